@@ -0,0 +1,43 @@
+"""
+Benchmark: escalado de `flujo.procesar_flujos_omega` con el número de workers.
+
+    python -m benchmarks.bench_flujos_batch [n_pares] [muestras_por_par]
+
+Imprime tiempo, throughput y speedup respecto al modo inline para
+1..os.cpu_count() procesos; el escalado debería ser casi lineal mientras
+el tamaño de lote amortice el pickling de los pares.
+"""
+import os
+import random
+import sys
+import time
+
+from villasmil_omega.flujo import procesar_flujos_omega
+
+
+def _pares(n_pares, muestras):
+    rng = random.Random(0)
+    return [([rng.random() for _ in range(muestras)], {"action": "force_probe"}) for _ in range(n_pares)]
+
+
+def _medir(pares, **kwargs):
+    t0 = time.perf_counter()
+    procesar_flujos_omega(pares, **kwargs)
+    return time.perf_counter() - t0
+
+
+def main():
+    n_pares = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    muestras = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    pares = _pares(n_pares, muestras)
+
+    base = _medir(pares, ejecutor="inline")
+    print(f"{'ejecutor':<10}{'workers':>8}{'seg':>10}{'pares/s':>12}{'speedup':>9}")
+    print(f"{'inline':<10}{1:>8}{base:>10.3f}{n_pares / base:>12.0f}{1.0:>9.2f}")
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        t = _medir(pares, ejecutor="procesos", max_workers=workers)
+        print(f"{'procesos':<10}{workers:>8}{t:>10.3f}{n_pares / t:>12.0f}{base / t:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
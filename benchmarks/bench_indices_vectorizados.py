@@ -0,0 +1,38 @@
+"""
+Benchmark: `indices.indices_mc` / `indices.indices_ci` frente a las funciones escalares por ventana.
+
+    python -m benchmarks.bench_indices_vectorizados [n_ventanas]
+"""
+import random
+import sys
+import time
+
+from villasmil_omega import core
+from villasmil_omega.indices import indices_ci, indices_mc
+
+
+def _medir(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    rng = random.Random(0)
+    a, e, r = ([rng.randint(0, 100) for _ in range(n)] for _ in range(3))
+    arrays = [core._np.asarray(c) for c in (a, e, r)] if core._np is not None else None
+
+    print(f"{'índice':<8}{'escalar s':>12}{'vector s':>12}{'speedup':>10}")
+    casos = (
+        ("MC", lambda: [core.indice_mc(x, y) for x, y in zip(a, e)], lambda: indices_mc(*arrays[:2])),
+        ("CI", lambda: [core.indice_ci(x, y, z) for x, y, z in zip(a, e, r)], lambda: indices_ci(*arrays)),
+    )
+    for nombre, escalar, vector in casos:
+        t_escalar = _medir(escalar)
+        t_vector = _medir(vector) if arrays is not None else float("nan")
+        print(f"{nombre:<8}{t_escalar:>12.3f}{t_vector:>12.4f}{t_escalar / t_vector:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
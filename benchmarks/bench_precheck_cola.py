@@ -0,0 +1,43 @@
+"""
+Benchmark: pre-chequeo L1 por la cola en `procesar_flujo_omega`.
+
+    python -m benchmarks.bench_precheck_cola [n_muestras]
+
+Compara payloads en paz (cola invariante) y turbulentos contra la
+referencia anterior (sanear todo `data` antes de consultar al guardián).
+"""
+import random
+import sys
+import time
+
+from villasmil_omega import core
+
+
+def _referencia(data, directiva):
+    num_data = core._sanear_escalar(data)
+    invariante = bool(num_data) and core.verificar_invariancia(num_data)
+    return core._decidir_flujo(invariante, lambda: core.calcular_raiz_ritmo(num_data), len(data), directiva)
+
+
+def _medir(fn, data, repeticiones):
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        fn(data, {})
+    return (time.perf_counter() - t0) / repeticiones
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(0)
+    turbulento = [rng.random() for _ in range(n)]
+    paz = turbulento[:-core.VENTANA_HISTORIA] + [0.5] * core.VENTANA_HISTORIA
+
+    print(f"{'payload':<12}{'referencia ms':>15}{'precheck ms':>14}{'speedup':>10}")
+    for nombre, data in (("paz", paz), ("turbulento", turbulento)):
+        ref = _medir(_referencia, data, 5)
+        nuevo = _medir(core.procesar_flujo_omega, data, 5)
+        print(f"{nombre:<12}{ref * 1e3:>15.3f}{nuevo * 1e3:>14.3f}{ref / nuevo:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: memoria y coste de construcción de los resultados compactos.
+
+    python -m benchmarks.bench_resultados_compactos [n_mediciones]
+
+Reporta bytes por medición guardada en `SistemaCoherenciaMaxima.history`
+(tracemalloc) y µs por llamada, con dicts anidados y con MedicionCompacta;
+y lo mismo para `procesar_flujo_omega(..., compacto=True)`. Los tiempos se
+toman en una pasada aparte, sin tracemalloc (que encarece cada asignación y
+domina la medida), como el mejor de varias repeticiones.
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from villasmil_omega import core
+from villasmil_omega.human_l2 import SistemaCoherenciaMaxima
+
+REPETICIONES = 5
+
+
+def _memoria_y_tiempo(ejecutar, n):
+    """(bytes retenidos por resultado, µs por llamada) de `ejecutar()`."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    guardados = ejecutar()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del guardados
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        t0 = time.perf_counter()
+        ejecutar()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return (despues - antes) / n, mejor / n * 1e6
+
+
+def _medir_historial(n, compacto):
+    rng = random.Random(0)
+    señales = [({"fatiga_fisica": rng.random()}, {"feedback_directo": rng.random()}) for _ in range(n)]
+
+    def ejecutar():
+        sistema = SistemaCoherenciaMaxima(historial_compacto=compacto)
+        for internas, relacionales in señales:
+            sistema.registrar_medicion(internas, relacionales)
+        return sistema
+
+    return _memoria_y_tiempo(ejecutar, n)
+
+
+def _medir_flujo(n, compacto):
+    data = [0.1, 0.9, 0.4]
+    directiva = {"action": "force_probe", "timestamp": 1}
+    return _memoria_y_tiempo(
+        lambda: [core.procesar_flujo_omega(data, directiva, compacto=compacto) for _ in range(n)], n
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    print(f"{'resultado':<28}{'bytes/guardado':>16}{'µs/llamada':>12}")
+    for nombre, fn in (("registrar_medicion", _medir_historial), ("procesar_flujo_omega", _medir_flujo)):
+        for compacto in (False, True):
+            b, us = fn(n, compacto)
+            etiqueta = f"{nombre} {'compacto' if compacto else 'dict'}"
+            print(f"{etiqueta:<28}{b:>16.0f}{us:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: sanitización en payloads limpios frente a payloads hostiles.
+
+    python -m benchmarks.bench_sanitizacion_hostil [n_elementos]
+
+Payload hostil como en tests/test_seguridad_hacker.py y test_apocalipsis_omega.py:
+dicts, None, listas, strings basura, strings numéricos, NaN/Inf y números.
+La columna "ratio" es hostil / limpio por elemento; cerca de 1 es lo deseado.
+"""
+import random
+import sys
+import time
+
+from villasmil_omega import core
+
+
+def _hostil(n, rng):
+    basura = [{"hack": 1}, None, [1, 2], "DROP TABLE", "<script>", "0.5", "nan", float("inf"), object(), "", 3]
+    return [rng.choice(basura) if rng.random() < 0.8 else rng.random() for _ in range(n)]
+
+
+def _medir(fn, repeticiones=3):
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        fn()
+    return (time.perf_counter() - t0) / repeticiones
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(0)
+    limpio = [rng.random() for _ in range(n)]
+    hostil = _hostil(n, rng)
+    directiva = {"action": "force_probe"}
+
+    casos = (
+        ("procesar_flujo_omega", lambda d: core.procesar_flujo_omega(d, directiva)),
+        ("  modo escalar", lambda d: core.procesar_flujo_omega(d, directiva, modo="escalar")),
+        ("calcular_raiz_ritmo", core.calcular_raiz_ritmo),
+        ("clamp", lambda d: [core.clamp(x) for x in d]),
+        ("suma_omega", lambda d: [core.suma_omega(x, 0.1) for x in d]),
+        ("indice_mc", lambda d: [core.indice_mc(x, 1) for x in d]),
+    )
+    print(f"{'función':<24}{'limpio ms':>12}{'hostil ms':>12}{'ratio':>8}")
+    for nombre, fn in casos:
+        t_limpio = _medir(lambda: fn(limpio))
+        t_hostil = _medir(lambda: fn(hostil))
+        print(f"{nombre:<24}{t_limpio * 1e3:>12.1f}{t_hostil * 1e3:>12.1f}{t_hostil / t_limpio:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
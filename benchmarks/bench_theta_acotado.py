@@ -0,0 +1,36 @@
+"""
+Benchmark: `calcular_theta` con premisas hostiles (textos y objetos gigantes),
+modo completo frente a modo acotado (`MarcadoresTheta(max_prefijo=..., max_sufijo=...)`).
+
+    python -m benchmarks.bench_theta_acotado [tam_premisa]
+"""
+import sys
+import time
+
+from villasmil_omega import core
+
+
+def _medir(cluster, marcadores):
+    t0 = time.perf_counter()
+    res = core.calcular_theta(cluster, marcadores)
+    return time.perf_counter() - t0, res
+
+
+def main():
+    tam = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    acotados = core.MarcadoresTheta(max_prefijo=4096, max_sufijo=256)
+    casos = (
+        ("texto gigante", ["Model A " + "x" * tam] * 4 + ["Model B"] * 4),
+        ("lista gigante", [["a" * 100] * (tam // 100)] * 8),
+        ("normal", ["Model A applies"] * 4 + ["Model B applies"] * 4),
+    )
+    print(f"{'cluster':<16}{'completo ms':>14}{'acotado ms':>14}")
+    for nombre, cluster in casos:
+        t_completo, r_completo = _medir(cluster, None)
+        t_acotado, r_acotado = _medir(cluster, acotados)
+        assert r_completo == r_acotado
+        print(f"{nombre:<16}{t_completo * 1e3:>14.2f}{t_acotado * 1e3:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark: theta de un corpus en disco (una premisa por línea).
+
+    python -m benchmarks.bench_theta_corpus [n_lineas]
+
+Compara cargar el archivo en una lista + `calcular_theta` contra
+`theta.calcular_theta_corpus` (mmap + rangos por línea) inline y en procesos.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from villasmil_omega import core
+from villasmil_omega.theta import calcular_theta_corpus
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(0)
+    vocab = "the agent must follow policy Model for this task is valid known data".split()
+    fd, ruta = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for i in range(n):
+                f.write(" ".join(rng.choice(vocab) for _ in range(20)))
+                f.write(" Model A\n" if i == n // 2 else "\n")
+        print(f"{n} líneas, {os.path.getsize(ruta) / 2**20:.1f} MiB")
+
+        t0 = time.perf_counter()
+        with open(ruta, encoding="utf-8") as f:
+            esperado = core.calcular_theta(f.read().splitlines())
+        print(f"{'lista + calcular_theta':<28}{time.perf_counter() - t0:>8.3f} s")
+        for ejecutor in ("inline", "procesos"):
+            t0 = time.perf_counter()
+            assert calcular_theta_corpus(ruta, ejecutor=ejecutor) == esperado
+            print(f"{'corpus ' + ejecutor:<28}{time.perf_counter() - t0:>8.3f} s")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: `calcular_theta` con marcadores compilados (una pasada por premisa).
+
+    python -m benchmarks.bench_theta_marcadores [n_premisas] [palabras_por_premisa]
+
+Compara contra la referencia anterior (lista `texts` + tres barridos).
+"""
+import random
+import sys
+import time
+
+from villasmil_omega import core
+
+
+def _referencia(cluster):
+    if not cluster:
+        return 0.0
+    texts = [str(x).lower().strip() for x in cluster]
+    unknowns = sum(1 for t in texts if "unknown" in t)
+    if unknowns > 0:
+        return core.clamp(unknowns / len(cluster), 0.0, 1.0)
+    if len(cluster) < 6:
+        return 0.0
+    if any("model a" in t for t in texts) and any("model b" in t for t in texts):
+        return 1.0
+    return core.THETA_BASE
+
+
+def _medir(fn, cluster, repeticiones):
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        res = fn(cluster)
+    return (time.perf_counter() - t0) / repeticiones, res
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    palabras = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    rng = random.Random(0)
+    vocab = "the agent must follow policy Model for this task is valid known data".split()
+    neutral = [" ".join(rng.choice(vocab) for _ in range(palabras)) for _ in range(n)]
+    conflicto = neutral[:-2] + ["use Model A", "use Model B"]
+    desconocido = [p + " unknown" if i % 100 == 0 else p for i, p in enumerate(neutral)]
+
+    print(f"{'cluster':<14}{'referencia ms':>15}{'marcadores ms':>15}{'speedup':>10}")
+    for nombre, cluster in (("neutral", neutral), ("conflicto", conflicto), ("desconocido", desconocido)):
+        ref, r0 = _medir(_referencia, cluster, 5)
+        nuevo, r1 = _medir(core.calcular_theta, cluster, 5)
+        assert r0 == r1
+        print(f"{nombre:<14}{ref * 1e3:>15.3f}{nuevo * 1e3:>15.3f}{ref / nuevo:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
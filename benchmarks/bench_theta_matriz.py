@@ -0,0 +1,48 @@
+"""
+Benchmark: matriz theta N×N desde resúmenes frente a `theta_for_two_clusters` por par.
+
+    python -m benchmarks.bench_theta_matriz [n_clusters] [premisas_por_cluster]
+
+La referencia por pares se mide sobre una muestra de filas y se extrapola.
+"""
+import random
+import sys
+import time
+
+from villasmil_omega import core
+from villasmil_omega.theta import matriz_theta, pares_theta, resumir_clusters
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    premisas = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = random.Random(0)
+    vocab = ["Model A applies", "Model B applies", "unknown source", "neutral premise"]
+    clusters = [rng.choices(vocab, weights=[1, 1, 0.01, 20], k=premisas) for _ in range(n)]
+
+    muestra = 5
+    t0 = time.perf_counter()
+    for a in clusters[:muestra]:
+        for b in clusters:
+            core.theta_for_two_clusters(a, b)
+    por_pares = (time.perf_counter() - t0) / muestra * n
+
+    t0 = time.perf_counter()
+    resumenes = resumir_clusters(clusters)
+    t_resumen = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    matriz_theta(resumenes)
+    t_matriz = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    pares = pares_theta(resumenes, 0.5)
+    t_pares = time.perf_counter() - t0
+
+    print(f"N={n}, {premisas} premisas por cluster")
+    print(f"theta_for_two_clusters por par (extrapolado): {por_pares:10.3f} s")
+    print(f"resumir_clusters:                             {t_resumen:10.3f} s")
+    print(f"matriz_theta:                                 {t_matriz:10.3f} s")
+    print(f"pares_theta(umbral=0.5):                      {t_pares:10.3f} s  ({len(pares)} pares)")
+
+
+if __name__ == "__main__":
+    main()
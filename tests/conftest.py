@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture
+def espia_float():
+    """Clase de muestra que cuenta cuántas veces se convierte a float (nueva por test)."""
+    class Espia:
+        conversiones = 0
+
+        def __init__(self, v):
+            self.v = v
+
+        def __float__(self):
+            Espia.conversiones += 1
+            return self.v
+
+    return Espia
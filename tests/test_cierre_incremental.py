@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from villasmil_omega.cierre.cierre import CierreIncremental, CierreSistema
+from villasmil_omega.cierre.invariancia import Invariancia
+
+
+def test_equivale_a_cierre_sistema_hasta_cerrar():
+    rng = random.Random(3)
+    inv = Invariancia(epsilon=0.01, ventana=4)
+    for _ in range(50):
+        scores = [rng.choice([0.5, 0.505, rng.random()]) for _ in range(40)]
+        cierre = CierreIncremental(inv)
+        for k, s in enumerate(scores):
+            esperado = CierreSistema(inv, scores[:k + 1]).evaluar()
+            assert cierre.agregar(s) is esperado
+            if esperado:
+                break
+
+
+def test_callback_se_dispara_una_sola_vez():
+    eventos = []
+    cierre = CierreIncremental(Invariancia(ventana=3), al_cerrar=eventos.append)
+    for s in [0.1, 0.9, 0.5, 0.5]:
+        assert cierre.agregar(s) is False
+    assert eventos == []
+    assert cierre.agregar(0.5) is True
+    for s in [0.5, 0.9, 0.5]:
+        assert cierre.agregar(s) is True
+    assert eventos == [cierre]
+    assert cierre.evaluar() is True
+    assert cierre.muestras == 5
+
+
+def test_suscribir_tras_cierre_notifica_de_inmediato():
+    cierre = CierreIncremental(Invariancia(ventana=1))
+    cierre.agregar(0.3)
+    eventos = []
+    cierre.suscribir(eventos.append)
+    assert eventos == [cierre]
+
+
+def test_callback_que_falla_no_reabre_ni_repite():
+    llamadas = []
+
+    def explota(c):
+        llamadas.append(c)
+        raise RuntimeError("liberación fallida")
+
+    cierre = CierreIncremental(Invariancia(ventana=2), al_cerrar=explota)
+    cierre.agregar(0.5)
+    with pytest.raises(RuntimeError):
+        cierre.agregar(0.5)
+    assert cierre.cerrado is True
+    assert cierre.agregar(0.5) is True
+    assert len(llamadas) == 1
+
+
+def test_callback_que_falla_no_impide_los_demas():
+    liberados = []
+
+    def explota(c):
+        raise RuntimeError("primero")
+
+    def explota_tambien(c):
+        raise ValueError("segundo")
+
+    cierre = CierreIncremental(Invariancia(ventana=2), al_cerrar=explota)
+    cierre.suscribir(explota_tambien)
+    cierre.suscribir(liberados.append)
+    cierre.agregar(0.5)
+    with pytest.raises(RuntimeError) as info:
+        cierre.agregar(0.5)
+    assert isinstance(info.value.__context__, ValueError)
+    assert liberados == [cierre]
+
+
+def test_reiniciar_reabre_y_conserva_callbacks():
+    eventos = []
+    cierre = CierreIncremental(Invariancia(ventana=2), al_cerrar=eventos.append)
+    cierre.agregar(0.5)
+    cierre.agregar(0.5)
+    cierre.reiniciar()
+    assert cierre.evaluar() is False and cierre.muestras == 0
+    assert cierre.agregar(0.7) is False
+    assert cierre.agregar(0.7) is True
+    assert len(eventos) == 2
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.indices import ACIERTO, ERROR, RUIDO, ContadorCI
+
+RESULTADOS = [ACIERTO, ERROR, RUIDO]
+
+
+def _conteo(eventos):
+    return [sum(1 for e in eventos if e == r) for r in RESULTADOS]
+
+
+def _eventos(semilla, n=500):
+    rng = random.Random(semilla)
+    return rng.choices(RESULTADOS, weights=[6, 3, 1], k=n)
+
+
+def test_acumulado_equivale_a_recontar():
+    contador = ContadorCI()
+    eventos = _eventos(1)
+    for k, e in enumerate(eventos):
+        assert contador.registrar(e) == core.indice_ci(*_conteo(eventos[:k + 1]))
+    assert contador.conteos == tuple(_conteo(eventos))
+    assert contador.eventos == len(eventos)
+
+
+@pytest.mark.parametrize("ventana", [1, 7, 100])
+def test_ventana_deslizante(ventana):
+    contador = ContadorCI(ventana=ventana)
+    eventos = _eventos(2)
+    for k, e in enumerate(eventos):
+        contador.registrar(e)
+        recientes = eventos[max(0, k + 1 - ventana):k + 1]
+        assert contador.conteos == tuple(_conteo(recientes))
+        assert contador.ci == core.indice_ci(*_conteo(recientes))
+
+
+def test_semivida_decae_pesos():
+    contador = ContadorCI(semivida=10)
+    eventos = _eventos(3, n=200)
+    for e in eventos:
+        contador.registrar(e)
+    f = 0.5 ** (1 / 10)
+    esperado = [
+        sum(f ** (len(eventos) - 1 - k) for k, e in enumerate(eventos) if e == r) for r in RESULTADOS
+    ]
+    assert contador.conteos == pytest.approx(esperado)
+    assert contador.ci == pytest.approx(core.indice_ci(*esperado))
+
+
+def test_semivida_olvida_el_pasado():
+    contador = ContadorCI(semivida=5)
+    for _ in range(200):
+        contador.registrar(ERROR)
+    for _ in range(100):
+        contador.registrar(ACIERTO)
+    assert contador.ci == core.C_MAX
+
+
+def test_vacio_reinicio_y_validacion():
+    contador = ContadorCI(ventana=3)
+    assert contador.ci == 0.0
+    contador.registrar(ACIERTO)
+    contador.reiniciar()
+    assert contador.conteos == (0, 0, 0) and contador.eventos == 0
+    with pytest.raises(ValueError):
+        contador.registrar("empate")
+    with pytest.raises(ValueError):
+        ContadorCI(ventana=3, semivida=2)
+    with pytest.raises(ValueError):
+        ContadorCI(ventana=0)
+    with pytest.raises(ValueError):
+        ContadorCI(semivida=0)
@@ -0,0 +1,87 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.flujo_async import ProcesadorOmegaAsync
+
+
+def _pares(n):
+    return [([((i + j) % 7) / 7.0 for j in range(10 + i % 5)],
+             {"action": "force_probe", "timestamp": i} if i % 2 else {}) for i in range(n)]
+
+
+def test_async_resuelve_cada_futuro_con_su_resultado():
+    pares = _pares(50)
+
+    async def main():
+        async with ProcesadorOmegaAsync(max_lote=8, max_espera_ms=5) as omega:
+            return await asyncio.gather(*(omega.procesar(d, dv) for d, dv in pares))
+
+    resultados = asyncio.run(main())
+    assert resultados == [core.procesar_flujo_omega(d, dv) for d, dv in pares]
+
+
+def test_async_agrupa_en_micro_lotes(monkeypatch):
+    import villasmil_omega.flujo_async as fa
+    tamanos = []
+    original = fa._procesar_lote_aislado
+
+    def espia(lote, modo="auto"):
+        tamanos.append(len(lote))
+        return original(lote, modo)
+
+    monkeypatch.setattr(fa, "_procesar_lote_aislado", espia)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            async with ProcesadorOmegaAsync(max_lote=10, max_espera_ms=50, ejecutor=pool) as omega:
+                await asyncio.gather(*(omega.procesar(d, dv) for d, dv in _pares(30)))
+
+    asyncio.run(main())
+    assert sum(tamanos) == 30
+    assert max(tamanos) <= 10
+    assert len(tamanos) < 30
+
+
+def test_async_payload_envenenado_solo_falla_su_peticion():
+    async def main():
+        async with ProcesadorOmegaAsync(max_lote=8, max_espera_ms=50) as omega:
+            return await asyncio.gather(
+                omega.procesar([0.1, 0.9, 0.3], {}),
+                omega.procesar(None, {}),
+                omega.procesar([0.2, 0.8], {}),
+                return_exceptions=True,
+            )
+
+    buenos1, envenenado, buenos2 = asyncio.run(main())
+    assert buenos1 == core.procesar_flujo_omega([0.1, 0.9, 0.3], {})
+    assert isinstance(envenenado, TypeError)
+    assert buenos2 == core.procesar_flujo_omega([0.2, 0.8], {})
+
+
+def test_async_backpressure_rechazo_con_cola_llena():
+    async def main():
+        omega = ProcesadorOmegaAsync(max_cola=1, max_lote=1, max_lotes_en_vuelo=1, rechazar_si_llena=True)
+        await omega.iniciar()
+        tareas = [asyncio.ensure_future(omega.procesar([0.1, 0.9], {})) for _ in range(5)]
+        resultados = await asyncio.gather(*tareas, return_exceptions=True)
+        await omega.cerrar()
+        return resultados
+
+    resultados = asyncio.run(main())
+    assert any(isinstance(r, asyncio.QueueFull) for r in resultados)
+    assert any(isinstance(r, dict) for r in resultados)
+
+
+def test_async_errores_de_configuracion_y_estado():
+    with pytest.raises(ValueError):
+        ProcesadorOmegaAsync(max_lote=0)
+    with pytest.raises(ValueError):
+        ProcesadorOmegaAsync(max_espera_ms=-1)
+
+    async def sin_iniciar():
+        await ProcesadorOmegaAsync().procesar([0.5], {})
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(sin_iniciar())
@@ -0,0 +1,63 @@
+import array
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.flujo import mapear_float64, procesar_archivo_float64, procesar_flujo_omega_stream
+
+
+def _muestras(n=2000):
+    rng = random.Random(5)
+    return [rng.uniform(-0.2, 1.2) for _ in range(n)] + [float("nan"), float("inf")]
+
+
+@pytest.mark.parametrize("directiva", [{}, {"action": "force_probe", "timestamp": 1}])
+def test_array_y_memoryview_equivalen_a_lista(directiva):
+    datos = _muestras()
+    esperado = core.procesar_flujo_omega(datos, directiva, modo="escalar")
+    buf = array.array("d", datos)
+    assert core.procesar_flujo_omega(buf, directiva) == esperado
+    assert core.procesar_flujo_omega(memoryview(buf), directiva) == esperado
+    assert core.calcular_raiz_ritmo(buf) == core.calcular_raiz_ritmo(datos)
+    assert core.calcular_raiz_ritmo(memoryview(buf), centro=0.3) == core.calcular_raiz_ritmo(datos, centro=0.3)
+
+
+def test_buffers_sin_numpy(monkeypatch):
+    datos = _muestras(300)
+    esperado = core.procesar_flujo_omega(datos, {"action": "force_probe"}, modo="escalar")
+    monkeypatch.setattr(core, "_np", None)
+    buf = array.array("d", datos)
+    assert core.procesar_flujo_omega(buf, {"action": "force_probe"}) == esperado
+    assert core.procesar_flujo_omega(memoryview(buf), {"action": "force_probe"}) == esperado
+
+
+def test_array_se_lee_sin_copia():
+    np = pytest.importorskip("numpy")
+    buf = array.array("d", [0.1, 0.2, 0.3])
+    assert np.shares_memory(core._como_array(buf), np.frombuffer(buf))
+
+
+@pytest.mark.parametrize("sin_numpy", [False, True])
+def test_archivo_float64_mapeado(tmp_path, monkeypatch, sin_numpy):
+    datos = _muestras()
+    ruta = tmp_path / "muestras.f64"
+    ruta.write_bytes(array.array("d", datos).tobytes())
+    esperado = core.procesar_flujo_omega(datos, {"action": "force_probe"}, modo="escalar")
+    if sin_numpy:
+        monkeypatch.setattr(core, "_np", None)
+
+    assert procesar_archivo_float64(str(ruta), {"action": "force_probe"}, chunk_size=256) == esperado
+    muestras = mapear_float64(str(ruta))
+    assert len(muestras) == len(datos)
+    assert procesar_flujo_omega_stream(muestras, {"action": "force_probe"}) == esperado
+
+
+def test_archivo_float64_vacio_y_truncado(tmp_path):
+    vacio = tmp_path / "vacio.f64"
+    vacio.write_bytes(b"")
+    assert procesar_archivo_float64(str(vacio), {}) == core.procesar_flujo_omega([], {})
+
+    truncado = tmp_path / "truncado.f64"
+    truncado.write_bytes(b"\x00" * 12)
+    with pytest.raises(ValueError):
+        mapear_float64(str(truncado))
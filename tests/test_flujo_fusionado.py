@@ -0,0 +1,57 @@
+import random
+
+import pytest
+from villasmil_omega import core
+
+
+def _payloads():
+    rng = random.Random(3)
+    return [
+        [rng.uniform(-0.5, 1.5) for _ in range(2000)],
+        [rng.random() for _ in range(100)] + ["0.25", True, None, "nan", float("-inf"), 10 ** 30, -0.0],
+        [0.1, 0.9] * 20 + [0.5] * 5,
+        [0.3, 0.3],
+        ["x", {}, []],
+        [],
+    ]
+
+
+@pytest.mark.parametrize("directiva", [{}, {"action": "force_probe", "timestamp": 5},
+                                       {"meta_auth": "active_meta_coherence"}])
+def test_fusionado_identico_a_escalar(directiva):
+    for data in _payloads():
+        esperado = core.procesar_flujo_omega(data, directiva, modo="escalar")
+        assert core.procesar_flujo_omega(data, directiva, modo="fusionado") == esperado
+        assert core.procesar_flujo_omega(data, directiva) == esperado
+
+
+def test_fusionado_convierte_cada_muestra_una_vez(espia_float):
+    rng = random.Random(8)
+    data = [espia_float(rng.random()) for _ in range(500)]
+    core.procesar_flujo_omega(data, {"action": "force_probe"}, modo="fusionado")
+    # una pasada + la cola que revisa el pre-chequeo L1
+    assert espia_float.conversiones == len(data) + core.VENTANA_HISTORIA
+
+
+def test_kernel_fusionado_estadisticos():
+    total, n, suma, cola = core._kernel_fusionado([0.0, 1.0, "x", float("nan"), 0.5], 0.5)
+    assert total == 5
+    assert n == 3
+    assert suma == pytest.approx(0.25 + (core.OMEGA_U - 0.5) ** 2)
+    assert cola == [0.0, core.OMEGA_U, 0.5]
+
+
+@pytest.mark.parametrize("modo", ["auto", "fusionado", "escalar"])
+@pytest.mark.parametrize("directiva", [{}, {"action": "force_probe", "timestamp": 3}])
+def test_generadores_e_iteradores(modo, directiva):
+    turbulento = [0.1, 0.9] * 10
+    paz = turbulento + [0.6] * core.VENTANA_HISTORIA
+    for data in (turbulento, paz, [], ["x", None]):
+        esperado = core.procesar_flujo_omega(list(data), directiva, modo=modo)
+        assert core.procesar_flujo_omega((x for x in data), directiva, modo=modo) == esperado
+        assert core.procesar_flujo_omega(iter(data), directiva, modo=modo) == esperado
+        assert core.procesar_flujo_omega(map(lambda x: x, data), directiva, modo=modo) == esperado
+    res = core.procesar_flujo_omega((x for x in paz), {})
+    assert res["invariante"] is True
+    res = core.procesar_flujo_omega((x for x in turbulento), {"action": "force_probe"})
+    assert res["processed_count"] == len(turbulento)
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.flujo import procesar_flujo_omega_stream
+
+
+def _payloads():
+    rng = random.Random(7)
+    return [
+        [rng.random() for _ in range(1000)],
+        [rng.uniform(-1.0, 2.0) for _ in range(333)] + [float("nan"), "0.4", None, "x"],
+        [0.9, 0.1] * 10 + [0.5] * 5,
+        [0.5, 0.5, 0.5],
+        [0.7],
+        [],
+        ["junk", {}, None],
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 100000])
+@pytest.mark.parametrize("directiva", [{}, {"action": "force_probe", "timestamp": 9}])
+def test_stream_equivale_a_procesar_flujo(chunk_size, directiva):
+    for data in _payloads():
+        esperado = core.procesar_flujo_omega(data, directiva, modo="escalar")
+        res = procesar_flujo_omega_stream(iter(data), directiva, chunk_size=chunk_size)
+        assert res == esperado
+
+
+def test_stream_desde_generador_largo():
+    gen = (0.2 + 0.6 * (i % 2) for i in range(200001))
+    res = procesar_flujo_omega_stream(gen, {"meta_auth": "active_meta_coherence"}, chunk_size=4096)
+    assert res["status"] == "evolving"
+    assert res["processed_count"] == 200001
+    assert 0.0 <= res["ritmo_omega"] <= core.OMEGA_U
+
+
+def test_stream_paz_en_la_cola():
+    data = [0.1, 0.9] * 1000 + [0.6] * core.VENTANA_HISTORIA
+    res = procesar_flujo_omega_stream(data, {"action": "force_probe"}, chunk_size=7)
+    assert res["invariante"] is True
+    assert res["path"] == "safety_lock"
+
+
+def test_stream_chunk_size_invalido():
+    with pytest.raises(ValueError):
+        procesar_flujo_omega_stream([0.5], {}, chunk_size=0)
+
+
+def test_stream_sin_numpy(monkeypatch):
+    data = _payloads()[0]
+    esperado = core.procesar_flujo_omega(data, {"action": "force_probe"}, modo="escalar")
+    monkeypatch.setattr(core, "_np", None)
+    assert procesar_flujo_omega_stream(data, {"action": "force_probe"}, chunk_size=50) == esperado
@@ -0,0 +1,62 @@
+import math
+import random
+
+import pytest
+from villasmil_omega import core
+
+
+def _payloads():
+    rng = random.Random(26)
+    return [
+        [rng.random() for _ in range(500)],
+        [rng.uniform(-2.0, 3.0) for _ in range(500)] + [float("nan"), float("inf"), -float("inf")],
+        [0.5, 0.5, 0.5, 0.5, 0.5],
+        [0.1, 0.9, 0.2, 0.8, 0.5, 0.5, 0.5, 0.5, 0.5],
+        [1, 2, 3],
+        [0.3],
+        [],
+        [float("nan")] * 10,
+    ]
+
+
+@pytest.mark.parametrize("directiva", [
+    {"action": "none"},
+    {"action": "force_probe", "timestamp": 123},
+    {"meta_auth": "active_meta_coherence"},
+])
+def test_vectorizado_identico_a_escalar(directiva):
+    np = pytest.importorskip("numpy")
+    for data in _payloads():
+        esperado = core.procesar_flujo_omega(data, directiva, modo="escalar")
+        assert core.procesar_flujo_omega(data, directiva, modo="vectorizado") == esperado
+        assert core.procesar_flujo_omega(np.array(data, dtype=float), directiva) == esperado
+
+
+def test_calcular_raiz_ritmo_acepta_ndarray():
+    np = pytest.importorskip("numpy")
+    for data in _payloads():
+        for centro in (None, 0.2, 0.9):
+            assert core.calcular_raiz_ritmo(np.asarray(data, dtype=float), centro=centro) == \
+                core.calcular_raiz_ritmo(data, centro=centro)
+
+
+def test_vectorizado_datos_mixtos_usan_camino_escalar():
+    pytest.importorskip("numpy")
+    data = [0.1, "0.9", None, {"x": 1}, "junk", 0.4, 0.7]
+    assert core.procesar_flujo_omega(data, {}, modo="vectorizado") == \
+        core.procesar_flujo_omega(data, {}, modo="escalar")
+
+
+def test_vectorizado_sin_numpy_cae_a_escalar(monkeypatch):
+    data = [0.1, 0.9, 0.2, 0.8, 0.5]
+    esperado = core.procesar_flujo_omega(data, {"action": "force_probe"}, modo="escalar")
+    monkeypatch.setattr(core, "_np", None)
+    res = core.procesar_flujo_omega(data, {"action": "force_probe"}, modo="vectorizado")
+    assert res == esperado
+    assert res["processed_count"] == 5
+    assert math.isfinite(res["ritmo_omega"])
+
+
+def test_modo_desconocido():
+    with pytest.raises(ValueError):
+        core.procesar_flujo_omega([0.5], {}, modo="turbo")
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.flujo import procesar_flujos_omega
+
+
+def _pares():
+    pares = []
+    for i in range(40):
+        data = [((i * 7 + j * 3) % 11) / 10.0 for j in range(20 + i)]
+        directiva = {"action": "force_probe", "timestamp": i} if i % 3 == 0 else {}
+        pares.append((data, directiva))
+    pares.append(([0.5] * 6, {}))
+    pares.append((["junk", None], {"meta_auth": "active_meta_coherence"}))
+    return pares
+
+
+def _esperado(pares):
+    return [core.procesar_flujo_omega(d, dv) for d, dv in pares]
+
+
+@pytest.mark.parametrize("ejecutor", ["inline", "hilos", "procesos"])
+def test_batch_respeta_orden(ejecutor):
+    pares = _pares()
+    assert procesar_flujos_omega(pares, ejecutor=ejecutor, max_workers=2, chunksize=5) == _esperado(pares)
+
+
+def test_batch_executor_externo():
+    pares = _pares()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        assert procesar_flujos_omega(pares, ejecutor=pool) == _esperado(pares)
+
+
+def test_batch_vacio_y_errores():
+    assert procesar_flujos_omega([], ejecutor="procesos") == []
+    with pytest.raises(ValueError):
+        procesar_flujos_omega(_pares(), ejecutor="gpu")
+    with pytest.raises(ValueError):
+        procesar_flujos_omega(_pares(), ejecutor="hilos", chunksize=0)
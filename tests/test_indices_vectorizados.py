@@ -0,0 +1,73 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.indices import indices_ci, indices_mc
+
+INF = float("inf")
+NAN = float("nan")
+ESPECIALES = [0, 0.0, 1, 3, -1, -2.5, 1e308, INF, -INF, NAN]
+
+
+def _columna(rng, n):
+    return [rng.choice(ESPECIALES) if rng.random() < 0.3 else rng.randint(0, 50) for _ in range(n)]
+
+
+@pytest.mark.parametrize("sin_numpy", [False, True])
+def test_mc_equivale_al_escalar(monkeypatch, sin_numpy):
+    if sin_numpy:
+        monkeypatch.setattr(core, "_np", None)
+    else:
+        pytest.importorskip("numpy")
+    rng = random.Random(1)
+    a, b = _columna(rng, 2000), _columna(rng, 2000)
+    assert list(indices_mc(a, b)) == [core.indice_mc(x, y) for x, y in zip(a, b)]
+
+
+@pytest.mark.parametrize("sin_numpy", [False, True])
+def test_ci_equivale_al_escalar(monkeypatch, sin_numpy):
+    if sin_numpy:
+        monkeypatch.setattr(core, "_np", None)
+    else:
+        pytest.importorskip("numpy")
+    rng = random.Random(2)
+    a, e, r = _columna(rng, 2000), _columna(rng, 2000), _columna(rng, 2000)
+    assert list(indices_ci(a, e, r)) == [core.indice_ci(x, y, z) for x, y, z in zip(a, e, r)]
+    assert list(indices_ci(a, e)) == [core.indice_ci(x, y) for x, y in zip(a, e)]
+
+
+def test_total_cero_y_techo_c_max():
+    np = pytest.importorskip("numpy")
+    res = indices_ci(np.array([0, 10, 5]), np.array([0, 0, 5]), np.array([0, 0, 0]))
+    assert res.tolist() == [0.0, core.C_MAX, 0.5]
+    assert indices_mc([0, 7], [0, 0]).tolist() == [0.0, core.C_MAX]
+
+
+def test_broadcasting_y_columnas_no_numericas():
+    np = pytest.importorskip("numpy")
+    assert indices_ci(np.arange(4), 2).tolist() == [core.indice_ci(i, 2) for i in range(4)]
+    # Columnas con None / basura: mismo resultado que la función escalar, fila a fila
+    a, b = [3, None, "x", "4"], [1, 1, 1, 4]
+    assert indices_mc(a, b) == [core.indice_mc(x, y) for x, y in zip(a, b)]
+
+
+@pytest.mark.parametrize("sin_numpy", [False, True])
+def test_columnas_desalineadas_lanzan_error(monkeypatch, sin_numpy):
+    if sin_numpy:
+        monkeypatch.setattr(core, "_np", None)
+    else:
+        pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        indices_mc([1, 2, 3], [1, 2])
+    with pytest.raises(ValueError):
+        indices_ci([1, 2, 3], [1, 2, 3], [0, 0])
+    # también cuando las columnas no son numéricas (camino fila a fila)
+    with pytest.raises(ValueError):
+        indices_mc([1, None, 3], [1, 2])
+    assert list(indices_mc([1, 2], 2)) == [core.indice_mc(1, 2), core.indice_mc(2, 2)]
+
+
+def test_enteros_fuera_de_rango_float():
+    pytest.importorskip("numpy")
+    a, b = [10 ** 400, 1], [1, 1]
+    assert indices_mc(a, b) == [core.indice_mc(x, y) for x, y in zip(a, b)]
@@ -0,0 +1,70 @@
+import random
+from collections import deque
+
+import pytest
+from villasmil_omega.cierre.invariancia import Invariancia, InvarianciaIncremental
+
+
+def _serie(rng, n):
+    serie = []
+    v = 0.5
+    for i in range(n):
+        r = rng.random()
+        if r < 0.6:
+            v = v + rng.uniform(-0.0008, 0.0008)       # calma
+        elif r < 0.9:
+            v = rng.random()                            # salto
+        serie.append(float("nan") if i % 97 == 0 else v)
+    return serie + [float("inf"), float("inf"), 0.2]
+
+
+@pytest.mark.parametrize("epsilon,ventana", [(1e-3, 1), (1e-3, 5), (5e-3, 12), (0.0, 3)])
+def test_push_equivale_a_es_invariante(epsilon, ventana):
+    rng = random.Random(ventana)
+    serie = _serie(rng, 3000)
+    inv = Invariancia(epsilon=epsilon, ventana=ventana)
+    inc = InvarianciaIncremental.desde(inv)
+    for i, v in enumerate(serie):
+        assert inc.push(v) is inv.es_invariante(serie[:i + 1]), i
+
+
+class _DequeContada(deque):
+    """Deque que cuenta las operaciones de las ventanas monótonas."""
+    operaciones = 0
+
+    def append(self, x):
+        _DequeContada.operaciones += 1
+        super().append(x)
+
+    def pop(self):
+        _DequeContada.operaciones += 1
+        return super().pop()
+
+    def popleft(self):
+        _DequeContada.operaciones += 1
+        return super().popleft()
+
+
+def test_push_ventana_grande_es_o1():
+    inc = InvarianciaIncremental(epsilon=1e-3, ventana=5000)
+    inc._maximos, inc._minimos = _DequeContada(), _DequeContada()
+    _DequeContada.operaciones = 0
+    resultados = [inc.push(0.5 + (i % 3) * 1e-4) for i in range(20000)]
+    assert resultados[4998] is False and resultados[4999] is True
+    # Series monótonas: la deque opuesta crece hasta la ventana y se vacía por la izquierda
+    serie = [1.0 - i * 1e-5 for i in range(20000)] + [i * 1e-5 for i in range(20000)]
+    for v in serie:
+        inc.push(v)
+    # Cada muestra entra una vez y sale a lo sumo una vez de cada deque
+    assert _DequeContada.operaciones <= 4 * (20000 + len(serie))
+    assert len(inc._maximos) <= inc.ventana and len(inc._minimos) <= inc.ventana
+
+
+def test_reiniciar_y_ventana_invalida():
+    inc = InvarianciaIncremental(ventana=2)
+    inc.push(0.5)
+    assert inc.push(0.5) is True
+    inc.reiniciar()
+    assert inc.push(0.5) is False
+    with pytest.raises(ValueError):
+        InvarianciaIncremental(ventana=0)
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+from villasmil_omega import core
+
+
+def _referencia(data, directiva):
+    """Semántica original: sanear todo y luego chequear L1."""
+    num_data = core._sanear_escalar(data)
+    invariante = bool(num_data) and core.verificar_invariancia(num_data)
+    return core._decidir_flujo(invariante, lambda: core.calcular_raiz_ritmo(num_data), len(data), directiva)
+
+
+def _payloads():
+    rng = random.Random(11)
+    turbulento = [rng.random() for _ in range(300)]
+    return [
+        turbulento + [0.5] * 5,
+        turbulento + [0.5, "x", 0.5, None, 0.5, float("nan"), 0.5, 0.5],
+        turbulento,
+        [0.5] * 4,
+        [0.5, 0.5, "junk", 0.5, 0.5],
+        [2.0, 3.0, 1.5, 7.0, 1.0],
+        ["a", None, {}],
+        [],
+    ]
+
+
+@pytest.mark.parametrize("directiva", [{}, {"action": "force_probe"}])
+def test_precheck_mantiene_resultados(directiva):
+    for data in _payloads():
+        esperado = _referencia(data, directiva)
+        assert core.procesar_flujo_omega(data, directiva, modo="escalar") == esperado
+        assert core.procesar_flujo_omega(tuple(data), directiva, modo="escalar") == esperado
+        assert core.procesar_flujo_omega(data, directiva, modo="vectorizado") == esperado
+
+
+def test_precheck_no_sanea_la_cabeza_en_paz(espia_float):
+    data = [espia_float(0.1 * (i % 9)) for i in range(1000)] + [0.4] * core.VENTANA_HISTORIA
+    res = core.procesar_flujo_omega(data, {"action": "force_probe"})
+    assert res["invariante"] is True
+    assert espia_float.conversiones == 0
+
+
+def test_precheck_vectorizado_cola_no_finita():
+    np = pytest.importorskip("numpy")
+    data = np.array([0.1, 0.9] * 50 + [0.5] * 5 + [np.nan])
+    assert core._precheck_cola_vectorizada(data) is None
+    assert core.procesar_flujo_omega(data, {}) == _referencia(data.tolist(), {})
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.core import RegistroGuardianes
+from villasmil_omega.flujo import procesar_flujo_omega_stream
+
+# Oscila por encima del epsilon global pero dentro de uno laxo
+CASI_PAZ = [0.1, 0.9] * 10 + [0.50, 0.51, 0.50, 0.51, 0.50]
+
+
+def test_sin_clave_usa_guardian_global():
+    for data in (CASI_PAZ, [0.6] * core.VENTANA_HISTORIA, [0.3, 0.7] * 20):
+        assert core.procesar_flujo_omega(data, {}, clave_flujo=None) == core.procesar_flujo_omega(data, {})
+
+
+def test_epsilon_por_tenant(monkeypatch):
+    registro = RegistroGuardianes()
+    registro.configurar("laxo", epsilon=0.05)
+    monkeypatch.setattr(core, "registro_guardianes", registro)
+
+    res = core.procesar_flujo_omega(CASI_PAZ, {"action": "force_probe"}, clave_flujo="laxo")
+    assert res["invariante"] is True
+    res = core.procesar_flujo_omega(CASI_PAZ, {"action": "force_probe"}, clave_flujo="estricto")
+    assert res["invariante"] is False
+
+
+@pytest.mark.parametrize("modo", core.MODOS_FLUJO)
+def test_ventana_por_tenant_en_todos_los_modos(monkeypatch, modo):
+    registro = RegistroGuardianes()
+    registro.configurar("corta", ventana=2)
+    monkeypatch.setattr(core, "registro_guardianes", registro)
+    data = [0.1, 0.9, 0.4, 0.4]
+    assert core.procesar_flujo_omega(data, {"action": "force_probe"}, modo=modo, clave_flujo="corta")["invariante"] is True
+    assert core.procesar_flujo_omega(data, {"action": "force_probe"}, modo=modo, clave_flujo="larga")["invariante"] is False
+
+
+def test_stream_con_clave(monkeypatch):
+    registro = RegistroGuardianes()
+    registro.configurar("laxo", epsilon=0.05)
+    monkeypatch.setattr(core, "registro_guardianes", registro)
+    res = procesar_flujo_omega_stream(iter(CASI_PAZ), {"action": "force_probe"}, chunk_size=3, clave_flujo="laxo")
+    assert res == core.procesar_flujo_omega(CASI_PAZ, {"action": "force_probe"}, clave_flujo="laxo")
+    assert res["invariante"] is True
+
+
+def test_desalojo_lru_conserva_configuracion():
+    registro = RegistroGuardianes(max_guardianes=2)
+    registro.configurar("a", epsilon=0.5)
+    ga = registro.obtener("a")
+    registro.obtener("b")
+    assert registro.obtener("a") is ga  # "a" pasa a ser el más reciente
+    registro.obtener("c")               # desaloja "b"
+    assert len(registro) == 2
+    assert "b" not in registro and "a" in registro and "c" in registro
+    registro.obtener("b")               # desaloja "a"
+    assert "a" not in registro
+    assert registro.obtener("a").epsilon == 0.5
+
+
+def test_eliminar_y_validacion():
+    registro = RegistroGuardianes()
+    registro.configurar("a", ventana=3)
+    registro.obtener("a")
+    registro.eliminar("a")
+    assert "a" not in registro
+    assert registro.obtener("a").ventana == core.VENTANA_HISTORIA
+    with pytest.raises(ValueError):
+        RegistroGuardianes(max_guardianes=0)
+
+
+def test_acceso_concurrente():
+    registro = RegistroGuardianes(max_guardianes=8)
+    errores = []
+
+    def trabajador(i):
+        try:
+            for k in range(500):
+                g = registro.obtener((i + k) % 32)
+                assert g.ventana == core.VENTANA_HISTORIA
+        except Exception as exc:  # pragma: no cover - sólo si hay carrera
+            errores.append(exc)
+
+    hilos = [threading.Thread(target=trabajador, args=(i,)) for i in range(8)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    assert not errores
+    assert len(registro) == 8
+
+
+def test_monkeypatch_guardian_global_sigue_vigente(monkeypatch):
+    class Siempre:
+        ventana = 1
+        def es_invariante(self, h):
+            return True
+
+    monkeypatch.setattr(core, "guardian_paz", Siempre())
+    assert core.procesar_flujo_omega([0.1, 0.9], {"action": "force_probe"})["invariante"] is True
+    assert core.verificar_invariancia([0.1, 0.9]) is True
@@ -0,0 +1,63 @@
+import pytest
+from villasmil_omega import core
+from villasmil_omega.human_l2 import SistemaCoherenciaMaxima
+from villasmil_omega.resultados import MedicionCompacta, ResultadoCompacto, ResultadoFlujo
+
+
+@pytest.mark.parametrize("data,directiva", [
+    ([0.5] * 6, {}),
+    ([0.1, 0.9, 0.3], {"action": "force_probe", "timestamp": 42}),
+    ([0.1, 0.9, 0.3], {"meta_auth": "active_meta_coherence"}),
+    ([0.1, 0.9, 0.3], {}),
+    ([0.46, 0.48, 0.47], {}),
+])
+def test_resultado_flujo_compatible_con_dict(data, directiva):
+    clasico = core.procesar_flujo_omega(data, directiva)
+    compacto = core.procesar_flujo_omega(data, directiva, compacto=True)
+    assert isinstance(compacto, ResultadoFlujo)
+    assert compacto == clasico
+    assert clasico == compacto
+    assert compacto.to_dict() == clasico
+    assert list(compacto) == list(clasico)
+    for clave, valor in clasico.items():
+        assert compacto[clave] == valor
+        assert compacto.get(clave) == valor
+    assert compacto.get("no_existe", "x") == "x"
+    with pytest.raises(KeyError):
+        compacto["no_existe"]
+
+
+def test_medicion_compacta_equivale_a_dict():
+    clasico = SistemaCoherenciaMaxima()
+    compacto = SistemaCoherenciaMaxima(historial_compacto=True)
+    señales = [({"fatiga_fisica": v}, {"feedback_directo": 1.0 - v}) for v in (0.1, 0.9, 0.2, 0.8, 0.5)]
+    for internas, relacionales in señales:
+        a = clasico.registrar_medicion(internas, relacionales)
+        b = compacto.registrar_medicion(internas, relacionales)
+        assert isinstance(b, MedicionCompacta)
+        assert b == a
+        assert b.to_dict() == a
+        assert b["estado_self"]["estado"] == a["estado_self"]["estado"]
+    assert compacto.get_estado_actual() == clasico.get_estado_actual()
+    assert core.ajustar_mc_ci_por_coherencia(0.8, 0.6, compacto.get_estado_actual()) == \
+        core.ajustar_mc_ci_por_coherencia(0.8, 0.6, clasico.get_estado_actual())
+
+
+def test_medicion_compacta_sin_dict_por_instancia():
+    m = MedicionCompacta(0.1, 0.1, "BASELINE", "BASELINE", "CONTINUAR", 1.0)
+    assert not hasattr(m, "__dict__")
+    with pytest.raises(AttributeError):
+        m.extra = 1
+
+
+def test_base_compacta_es_abstracta():
+    class SinValor(ResultadoCompacto):
+        __slots__ = ()
+
+        def _claves(self):
+            return ("a",)
+
+    with pytest.raises(TypeError):
+        ResultadoCompacto()
+    with pytest.raises(TypeError):
+        SinValor()
@@ -0,0 +1,88 @@
+import array
+import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.indices import ResumenMC, resumir_mc_archivos
+
+
+def _muestras(semilla, n=1000):
+    rng = random.Random(semilla)
+    return [rng.uniform(-0.2, 1.2) for _ in range(n)]
+
+
+def test_equivale_a_indice_mc():
+    for semilla in range(20):
+        datos = _muestras(semilla, n=semilla * 7)
+        assert ResumenMC.desde(datos).mc == pytest.approx(core.indice_mc(datos), abs=1e-12)
+    assert ResumenMC().mc == core.indice_mc([]) == 0.0
+
+
+def test_fusion_asociativa_entre_shards():
+    shards = [_muestras(s, n=200 + s) for s in range(6)]
+    resumenes = [ResumenMC.desde(s) for s in shards]
+    izquierda = ((resumenes[0] + resumenes[1]) + resumenes[2]) + (resumenes[3] + (resumenes[4] + resumenes[5]))
+    derecha = resumenes[0]
+    for r in resumenes[1:]:
+        derecha = derecha.fusionar(r)
+    todo = [x for s in shards for x in s]
+    assert izquierda.n == derecha.n == len(todo)
+    assert izquierda.mc == derecha.mc == pytest.approx(core.indice_mc(todo), abs=1e-12)
+    assert resumenes[0].n == len(shards[0])  # la fusión no modifica operandos
+
+
+def test_suma_compensada_sin_cancelacion():
+    # Términos grandes que se cancelan: una suma ingenua pierde las unidades
+    datos = [1e16, 1.0, -1e16, 1.0] * 250
+    resumen = ResumenMC.desde(datos)
+    assert resumen.total == 500.0
+    assert resumen.mc == core.clamp(0.5, 0.0, core.C_MAX)
+
+
+def test_muestra_no_numerica_anula_como_el_escalar():
+    datos = [0.5, "0.7", None, 0.1]
+    assert core.indice_mc(datos) == 0.0
+    assert ResumenMC.desde(datos).mc == 0.0
+    assert (ResumenMC.desde([0.5]) + ResumenMC.desde(["x"])).mc == 0.0
+    assert ResumenMC.desde([0.5, "0.7"]).mc == core.indice_mc([0.5, "0.7"])
+
+
+@pytest.mark.parametrize("sin_numpy", [False, True])
+def test_fuentes_buffer(monkeypatch, sin_numpy):
+    if sin_numpy:
+        monkeypatch.setattr(core, "_np", None)
+    datos = _muestras(3, n=5000)
+    resumen = ResumenMC()
+    resumen.extender(array.array("d", datos), chunk_size=333)
+    assert resumen.n == len(datos)
+    assert resumen.mc == pytest.approx(core.indice_mc(datos), abs=1e-12)
+
+
+def _escribir(tmp_path, nombre, datos):
+    ruta = tmp_path / nombre
+    ruta.write_bytes(array.array("d", datos).tobytes())
+    return str(ruta)
+
+
+def test_archivos_en_procesos_hilos_e_inline(tmp_path):
+    shards = [_muestras(s, n=3000) for s in range(4)] + [[]]
+    rutas = [_escribir(tmp_path, f"shard{i}.f64", s) for i, s in enumerate(shards)]
+    esperado = core.indice_mc([x for s in shards for x in s])
+    for ejecutor in ("inline", "hilos", "procesos"):
+        res = resumir_mc_archivos(rutas, ejecutor=ejecutor, max_workers=2, chunk_size=500)
+        assert res.n == 12000
+        # la suma compensada coincide con fsum; `sum` del escalar puede derivar
+        assert res.total == pytest.approx(math.fsum(x for s in shards for x in s), rel=1e-15)
+        assert res.mc == pytest.approx(esperado, abs=1e-12)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert resumir_mc_archivos(rutas, ejecutor=pool).mc == pytest.approx(esperado, abs=1e-12)
+
+
+def test_validacion(tmp_path):
+    with pytest.raises(ValueError):
+        resumir_mc_archivos([], ejecutor="gpu")
+    with pytest.raises(ValueError):
+        resumir_mc_archivos([], chunk_size=0)
+    assert resumir_mc_archivos([]).mc == 0.0
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.ritmo import RitmoAcumulador
+
+
+def test_acumulador_ilimitado_equivale_a_calcular_raiz_ritmo():
+    rng = random.Random(1)
+    acc = RitmoAcumulador()
+    historial = []
+    assert acc.indice == core.OMEGA_U
+    for i in range(3000):
+        x = rng.uniform(-0.2, 1.2) if i % 17 else "ruido"
+        historial.append(x)
+        acc.agregar(x)
+        if i % 250 == 0:
+            assert acc.indice == pytest.approx(core.calcular_raiz_ritmo(historial), abs=1e-12)
+    assert acc.indice == pytest.approx(core.calcular_raiz_ritmo(historial), abs=1e-12)
+
+
+@pytest.mark.parametrize("ventana,centro", [(1, None), (5, None), (64, 0.8), (1000, 0.1)])
+def test_acumulador_ventana_deslizante(ventana, centro):
+    rng = random.Random(ventana)
+    acc = RitmoAcumulador(centro=centro, ventana=ventana)
+    validos = []
+    for i in range(4000):
+        x = rng.random() if i % 31 else float("nan")
+        if acc.agregar(x):
+            validos.append(x)
+        assert len(acc) == min(len(validos), ventana)
+        if i % 97 == 0:
+            esperado = core.calcular_raiz_ritmo(validos[-ventana:], centro=centro)
+            assert acc.indice == pytest.approx(esperado, abs=1e-12)
+
+
+def test_acumulador_descartar_y_errores():
+    acc = RitmoAcumulador(ventana=3)
+    for x in (0.1, 0.9, 0.5):
+        acc.agregar(x)
+    acc.descartar()
+    assert len(acc) == 2
+    assert acc.indice == pytest.approx(core.calcular_raiz_ritmo([0.9, 0.5]), abs=1e-12)
+    acc.descartar()
+    acc.descartar()
+    acc.descartar()
+    assert len(acc) == 0 and acc.indice == core.OMEGA_U
+
+    assert RitmoAcumulador().agregar(None) is False
+    with pytest.raises(ValueError):
+        RitmoAcumulador().descartar()
+    with pytest.raises(ValueError):
+        RitmoAcumulador(ventana=0)
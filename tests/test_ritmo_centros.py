@@ -0,0 +1,43 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.ritmo import EstadisticosRitmo, calcular_raiz_ritmo_centros
+
+CENTROS = [i / 40 for i in range(41)] + [core.C_MAX / 2.0, -0.5, 1.5]
+
+
+def _historiales():
+    rng = random.Random(9)
+    return [
+        [rng.uniform(-0.2, 1.2) for _ in range(1500)] + ["x", None, float("nan")],
+        [0.4815] * 100,
+        [0.3, 0.3000001, 0.2999999] * 50,
+        [0.7],
+        [],
+    ]
+
+
+def test_centros_equivalen_a_llamadas_individuales():
+    for h in _historiales():
+        res = list(calcular_raiz_ritmo_centros(h, CENTROS))
+        esperado = [core.calcular_raiz_ritmo(h, centro=c) for c in CENTROS]
+        assert res == pytest.approx(esperado, abs=1e-12)
+
+
+def test_centros_sin_numpy(monkeypatch):
+    h = _historiales()[0]
+    esperado = [core.calcular_raiz_ritmo(h, centro=c) for c in CENTROS]
+    monkeypatch.setattr(core, "_np", None)
+    res = calcular_raiz_ritmo_centros(h, CENTROS)
+    assert isinstance(res, list)
+    assert res == pytest.approx(esperado, abs=1e-12)
+
+
+def test_estadisticos_ritmo_desde_ndarray():
+    np = pytest.importorskip("numpy")
+    h = _historiales()[0][:-3]
+    est = EstadisticosRitmo.desde(np.array(h))
+    assert est.n == len(h)
+    assert est.indice() == pytest.approx(core.calcular_raiz_ritmo(h), abs=1e-12)
+    assert EstadisticosRitmo.desde(None).indice() == core.OMEGA_U
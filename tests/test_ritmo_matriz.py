@@ -0,0 +1,50 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.ritmo import calcular_raiz_ritmo_matriz
+
+
+def _matriz(filas=200, muestras=50):
+    rng = random.Random(4)
+    m = [[rng.uniform(-0.3, 1.3) for _ in range(muestras)] for _ in range(filas)]
+    m[0] = [float("nan")] * muestras
+    m[1] = [float("nan")] * (muestras - 1) + [0.4]
+    m[2] = [float("inf"), 0.2, float("-inf"), 0.8] + [float("nan")] * (muestras - 4)
+    m[3] = [0.481] * muestras
+    return m
+
+
+@pytest.mark.parametrize("centros", [None, 0.2, "por_fila"])
+def test_matriz_equivale_a_escalar(centros):
+    np = pytest.importorskip("numpy")
+    m = _matriz()
+    if centros == "por_fila":
+        centros = [i / len(m) for i in range(len(m))]
+    res = calcular_raiz_ritmo_matriz(np.array(m), centros)
+    assert isinstance(res, np.ndarray) and res.shape == (len(m),)
+    por_fila = centros if isinstance(centros, list) else [centros] * len(m)
+    esperado = [core.calcular_raiz_ritmo(f, centro=c) for f, c in zip(m, por_fila)]
+    assert res.tolist() == pytest.approx(esperado, abs=1e-12)
+
+
+def test_matriz_sin_numpy_o_no_numerica(monkeypatch):
+    m = _matriz(10, 8)
+    esperado = [core.calcular_raiz_ritmo(f, centro=0.3) for f in m]
+    m_sucia = [f[:-1] + ["x"] for f in m]
+    esperado_sucia = [core.calcular_raiz_ritmo(f, centro=0.3) for f in m_sucia]
+    assert calcular_raiz_ritmo_matriz(m_sucia, 0.3) == esperado_sucia
+    monkeypatch.setattr(core, "_np", None)
+    assert calcular_raiz_ritmo_matriz(m, 0.3) == esperado
+
+
+def test_matriz_con_enteros_desbordados_usa_fila_a_fila():
+    m = [[10 ** 400, 0.5], [0.2, 0.4]]
+    esperado = [core.calcular_raiz_ritmo(f, centro=0.3) for f in m]
+    assert calcular_raiz_ritmo_matriz(m, 0.3) == esperado
+
+
+def test_matriz_dimension_invalida():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        calcular_raiz_ritmo_matriz(np.zeros(5))
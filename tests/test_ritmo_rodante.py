@@ -0,0 +1,47 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.ritmo import calcular_raiz_ritmo_rodante
+
+
+def _historial(n=600):
+    rng = random.Random(12)
+    h = [rng.uniform(-0.1, 1.1) for _ in range(n)]
+    for i in range(0, n, 13):
+        h[i] = float("nan")
+    h[5] = "ruido"
+    h[6] = None
+    return h
+
+
+def _esperado(h, w, centro=None):
+    return [core.calcular_raiz_ritmo(h[max(0, i - w + 1):i + 1], centro=centro) for i in range(len(h))]
+
+
+@pytest.mark.parametrize("w,centro", [(1, None), (2, None), (10, 0.3), (50, None), (1000, 0.9)])
+def test_rodante_equivale_a_ventanas_individuales(w, centro):
+    h = _historial()
+    res = calcular_raiz_ritmo_rodante(h, w, centro)
+    assert len(res) == len(h)
+    assert list(res) == pytest.approx(_esperado(h, w, centro), abs=1e-9)
+
+
+def test_rodante_ndarray_y_sin_numpy(monkeypatch):
+    np = pytest.importorskip("numpy")
+    h = [v if isinstance(v, float) else float("nan") for v in _historial(300)]
+    esperado = _esperado(h, 25)
+    res = calcular_raiz_ritmo_rodante(np.array(h), 25)
+    assert isinstance(res, np.ndarray)
+    assert res.tolist() == pytest.approx(esperado, abs=1e-9)
+
+    monkeypatch.setattr(core, "_np", None)
+    res = calcular_raiz_ritmo_rodante(h, 25)
+    assert isinstance(res, list)
+    assert res == pytest.approx(esperado, abs=1e-9)
+
+
+def test_rodante_bordes():
+    assert list(calcular_raiz_ritmo_rodante([], 5)) == []
+    with pytest.raises(ValueError):
+        calcular_raiz_ritmo_rodante([0.5], 0)
@@ -0,0 +1,101 @@
+import decimal
+import fractions
+import math
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.core import _a_float
+
+
+def _float_referencia(x):
+    try:
+        return float(x)
+    except Exception:
+        return None
+
+
+class SinFloat:
+    pass
+
+
+class ConFloat:
+    def __float__(self):
+        return 0.25
+
+
+class FloatRoto:
+    def __float__(self):
+        raise TypeError("no hoy")
+
+
+ZOO = [
+    0.5, -0.0, float("nan"), float("inf"), 3, True, False, 10 ** 400, -(10 ** 400),
+    "0.5", " 0.7 ", "  5", "-1e3", "+.5", "inf", "-Infinity", "NaN", "nan_payload", "١٢", "1_0",
+    "", "   ", "hack", "<script>", "DROP TABLE", "0x10", "½", "e5",
+    b"1.5", bytearray(b"2"), b"junk", memoryview(b"3"),
+    None, {"a": 1}, [1], (1,), {1}, frozenset(), 1j,
+    decimal.Decimal("1.5"), fractions.Fraction(1, 4), ConFloat(), SinFloat(), FloatRoto(), object(),
+]
+
+
+@pytest.mark.parametrize("x", ZOO, ids=repr)
+def test_a_float_equivale_a_float_con_try(x):
+    esperado = _float_referencia(x)
+    obtenido = _a_float(x)
+    if esperado is None or obtenido is None:
+        assert obtenido is esperado
+    elif math.isnan(esperado):
+        assert math.isnan(obtenido)
+    else:
+        assert obtenido == esperado
+
+
+def test_entradas_hostiles_no_cambian_el_parseo_posterior():
+    validos = [memoryview(b"0.5")] * 6
+    antes = core.procesar_flujo_omega(validos, {})
+    assert _a_float(memoryview(b"0.5 0.5")[::2]) is None  # no contiguo: float() lanza TypeError
+    core.procesar_flujo_omega([memoryview(b"0.5 0.5")[::2], SinFloat()] * 3, {})
+    assert core.procesar_flujo_omega(validos, {}) == antes
+    assert core.clamp(memoryview(b"0.7")) == 0.7
+
+
+def _sanear_referencia(data):
+    out = []
+    for x in data:
+        try:
+            v = float(x)
+        except Exception:
+            continue
+        if math.isfinite(v):
+            out.append(core.clamp(v, 0.0, 1.0))
+    return out
+
+
+def _hostil(semilla, n=2000):
+    rng = random.Random(semilla)
+    return [rng.choice(ZOO) if rng.random() < 0.7 else rng.uniform(-0.5, 1.5) for _ in range(n)]
+
+
+def test_funciones_publicas_equivalen_en_payload_hostil():
+    data = _hostil(1)
+    assert core._sanear_escalar(data) == _sanear_referencia(data)
+    assert core.calcular_raiz_ritmo(data) == core.calcular_raiz_ritmo(_sanear_referencia(data))
+    for modo in ("escalar", "fusionado", "auto"):
+        assert core.procesar_flujo_omega(data, {"action": "force_probe"}, modo=modo) == \
+            core.procesar_flujo_omega(_sanear_referencia(data), {"action": "force_probe"}, modo=modo) | \
+            {"processed_count": len(data)}
+
+
+def test_clamp_suma_omega_e_indice_mc():
+    for x in ZOO:
+        ref = _float_referencia(x)
+        esperado_clamp = 0.0 if ref is None or not math.isfinite(ref) else max(0.0, min(ref, min(1.0, core.OMEGA_U)))
+        assert core.clamp(x) == esperado_clamp
+        ref_suma = 0.1 if ref is None or not math.isfinite(ref) else None
+        if ref_suma is not None:
+            assert core.suma_omega(x, 0.1) == ref_suma
+            assert core.suma_omega(0.1, x) == ref_suma
+        assert core.indice_mc(x, 1) == (0.0 if ref is None else core.indice_mc(ref, 1))
+        assert core.indice_mc([0.5, x]) == (0.0 if ref is None else core.indice_mc([0.5, ref]))
+    assert core.suma_omega(None, {}) == 0.0
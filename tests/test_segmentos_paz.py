@@ -0,0 +1,67 @@
+import array
+import mmap
+import random
+
+import pytest
+from villasmil_omega.cierre.invariancia import Invariancia
+
+
+def _referencia(inv, h):
+    """Definición directa (cuadrática): es_invariante sobre cada prefijo."""
+    segmentos, inicio = [], None
+    for k in range(len(h)):
+        if inv.es_invariante(h[:k + 1]):
+            inicio = k if inicio is None else inicio
+        elif inicio is not None:
+            segmentos.append((inicio, k - 1))
+            inicio = None
+    if inicio is not None:
+        segmentos.append((inicio, len(h) - 1))
+    return segmentos
+
+
+def _historial(n=1500):
+    rng = random.Random(14)
+    h, v = [], 0.5
+    for _ in range(n):
+        if rng.random() < 0.05:
+            v = rng.random()
+        h.append(v + rng.uniform(-0.0004, 0.0004))
+    return h
+
+
+@pytest.mark.parametrize("ventana", [1, 5, 20])
+def test_segmentos_equivalen_a_prefijos(ventana):
+    inv = Invariancia(epsilon=1e-3, ventana=ventana)
+    h = _historial()
+    segmentos = inv.segmentos_paz(h)
+    assert segmentos == _referencia(inv, h)
+    assert segmentos
+
+
+def test_segmentos_desde_array_memoryview_ndarray_y_mmap(tmp_path):
+    from villasmil_omega.flujo import mapear_float64
+    inv = Invariancia(epsilon=1e-3, ventana=5)
+    h = _historial(800)
+    esperado = inv.segmentos_paz(h)
+    buf = array.array("d", h)
+    assert inv.segmentos_paz(buf) == esperado
+    assert inv.segmentos_paz(memoryview(buf)) == esperado
+    assert inv.segmentos_paz(iter(h)) == esperado
+
+    ruta = tmp_path / "h.f64"
+    ruta.write_bytes(buf.tobytes())
+    assert inv.segmentos_paz(mapear_float64(str(ruta))) == esperado
+    with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as crudo:
+        assert inv.segmentos_paz(crudo) == esperado
+
+    np = pytest.importorskip("numpy")
+    assert inv.segmentos_paz(np.array(h)) == esperado
+
+
+def test_segmentos_bordes():
+    inv = Invariancia(epsilon=1e-3, ventana=3)
+    assert inv.segmentos_paz([]) == []
+    assert inv.segmentos_paz([0.5, 0.5]) == []
+    assert inv.segmentos_paz([0.5] * 4) == [(2, 3)]
+    assert inv.segmentos_paz([0.5] * 3 + [0.9] + [0.5] * 3) == [(2, 2), (6, 6)]
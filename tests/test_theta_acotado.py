@@ -0,0 +1,99 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.core import MarcadoresTheta, calcular_theta
+from villasmil_omega.theta import AcumuladorTheta, calcular_theta_corpus
+
+ACOTADOS = MarcadoresTheta(max_prefijo=64, max_sufijo=16)
+GRANDE = 2_000_000
+
+
+def test_premisas_cortas_equivalen_al_modo_completo():
+    rng = random.Random(4)
+    fragmentos = ["Model A", "MODEL B", "unknown", "neutral", 5, None]
+    for _ in range(200):
+        cluster = [" ".join(str(rng.choice(fragmentos)) for _ in range(rng.randint(0, 5)))
+                   for _ in range(rng.randint(0, 10))]
+        assert calcular_theta(cluster, ACOTADOS) == calcular_theta(cluster)
+
+
+def test_texto_gigante_solo_se_mira_la_ventana():
+    relleno = "x" * GRANDE
+    assert calcular_theta(["UNKNOWN " + relleno, "ok"], ACOTADOS) == 0.5
+    assert calcular_theta([relleno + " unknown", "ok"], ACOTADOS) == 0.5       # en el sufijo
+    assert calcular_theta([relleno[:1000] + "unknown" + relleno, "ok"], ACOTADOS) == 0.0  # fuera de ventana
+    assert calcular_theta([relleno[:1000] + "unknown" + relleno, "ok"]) == 0.5
+    assert len(ACOTADOS.normalizar(relleno)) <= 64 + 1 + 16
+
+
+def test_prefijo_y_sufijo_no_se_unen_en_un_marcador():
+    marcadores = MarcadoresTheta(max_prefijo=4, max_sufijo=3)
+    # "unkn" + "own" sólo formaría el marcador si se concatenaran sin separador
+    assert calcular_theta(["unkn" + "z" * 100 + "own"], marcadores) == 0.0
+
+
+def test_objetos_enormes_no_se_convierten_enteros():
+    enorme = ["unknown"] + ["a" * 1000] * 100_000
+    texto = ACOTADOS.normalizar(enorme)
+    assert len(texto) <= 64 + 1 + 16
+    assert calcular_theta([enorme], ACOTADOS) == core.clamp(1.0, 0.0, 1.0)
+    assert calcular_theta([b"model a" + b"x" * GRANDE] * 3 + [b"model b"] * 3, ACOTADOS) == 1.0
+
+
+def test_marcadores_distintos_por_limites_y_validacion():
+    assert MarcadoresTheta(max_prefijo=10) != MarcadoresTheta()
+    with pytest.raises(ValueError):
+        AcumuladorTheta(MarcadoresTheta(max_prefijo=10)) + AcumuladorTheta()
+    with pytest.raises(ValueError):
+        MarcadoresTheta(max_prefijo=0)
+    with pytest.raises(ValueError):
+        MarcadoresTheta(max_sufijo=5)
+
+
+def test_corpus_respeta_el_modo_acotado(tmp_path):
+    ruta = tmp_path / "corpus.txt"
+    ruta.write_text("x" * 500 + " unknown\nok\n", encoding="utf-8")
+    assert calcular_theta_corpus(str(ruta), ejecutor="inline") == 0.5
+    assert calcular_theta_corpus(str(ruta), marcadores=MarcadoresTheta(max_prefijo=100), ejecutor="procesos") == 0.0
+
+
+def test_subclases_y_conversiones_hostiles_quedan_acotadas():
+    from collections import Counter, OrderedDict, defaultdict
+
+    pasos = [0]
+
+    class DictContado(defaultdict):
+        def items(self):
+            for par in super().items():
+                pasos[0] += 1
+                yield par
+
+    class ListaContada(list):
+        def __iter__(self):
+            for x in super().__iter__():
+                pasos[0] += 1
+                yield x
+
+    class Texto(str):
+        def lower(self):  # no debe usarse: se normaliza como str plano
+            raise RuntimeError("lower de subclase")
+
+    n = 300_000
+    hostiles = [
+        defaultdict(int, {f"k{i}": i for i in range(n)}),
+        OrderedDict((f"k{i}", "x" * 10) for i in range(n)),
+        Counter({f"k{i}": i for i in range(n)}),
+        Texto("unknown " + "x" * GRANDE),
+        10 ** 5000,
+    ]
+    for premisa in hostiles:
+        assert len(ACOTADOS.normalizar(premisa)) <= 64 + 1 + 16 + 8
+    # El recorrido se corta al llenar la ventana: sólo unos pocos elementos se leen
+    for contenedor in (DictContado(int, {f"k{i}": i for i in range(n)}), ListaContada(range(n))):
+        pasos[0] = 0
+        assert len(ACOTADOS.normalizar(contenedor)) <= 64 + 1 + 16 + 8
+        assert 0 < pasos[0] <= 64 + 16
+    assert calcular_theta([10 ** 5000, "ok"], ACOTADOS) == 0.0
+    assert calcular_theta([Texto("UNKNOWN " + "x" * GRANDE)], ACOTADOS) == core.clamp(1.0, 0.0, 1.0)
+    assert calcular_theta([OrderedDict(a="model a")] * 3 + [Counter(["model b"])] * 3, ACOTADOS) == 1.0
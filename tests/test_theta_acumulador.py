@@ -0,0 +1,56 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.theta import AcumuladorTheta
+
+FRAGMENTOS = ["Model A", "MODEL B", "unknown", "neutral", "model", "", 7, None]
+
+
+def _cluster(rng, n_max=10):
+    return [" ".join(str(rng.choice(FRAGMENTOS)) for _ in range(rng.randint(0, 3)))
+            for _ in range(rng.randint(0, n_max))]
+
+
+def test_incremental_equivale_a_calcular_theta():
+    rng = random.Random(5)
+    for _ in range(200):
+        cluster = _cluster(rng)
+        acc = AcumuladorTheta()
+        for k, premisa in enumerate(cluster):
+            acc.agregar(premisa)
+            assert acc.theta == core.calcular_theta(cluster[:k + 1])
+        assert len(acc) == len(cluster)
+        assert AcumuladorTheta.desde(cluster).theta == core.calcular_theta(cluster)
+
+
+def test_fusion_equivale_al_cluster_concatenado():
+    rng = random.Random(9)
+    for _ in range(200):
+        c1, c2 = _cluster(rng), _cluster(rng)
+        a1, a2 = AcumuladorTheta.desde(c1), AcumuladorTheta.desde(c2)
+        combinado = a1 + a2
+        assert combinado.theta == core.calcular_theta(c1 + c2)
+        assert a1.theta == core.calcular_theta(c1)  # la fusión no modifica operandos
+        assert core.theta_for_two_clusters(c1, c2) == {
+            "theta_c1": core.compute_theta(c1),
+            "theta_c2": core.compute_theta(c2),
+            "theta_combined": core.compute_theta(c1 + c2),
+        }
+
+
+def test_conflicto_repartido_entre_clusters():
+    a = AcumuladorTheta.desde(["model a"] * 3)
+    b = AcumuladorTheta.desde(["model b"] * 3)
+    assert a.theta == 0.0 and b.theta == 0.0
+    assert a.fusionar(b).conflicto is True
+    assert (a + b).theta == 1.0
+
+
+def test_marcadores_propios_y_fusion_incompatible():
+    propios = core.MarcadoresTheta(desconocido=("n/d",), conflicto=("x", "y"))
+    acc = AcumuladorTheta.desde(["n/d", "ok"], propios)
+    assert acc.theta == core.calcular_theta(["n/d", "ok"], propios)
+    assert (acc + AcumuladorTheta(core.MarcadoresTheta(desconocido=("n/d",), conflicto=("x", "y")))).n == 2
+    with pytest.raises(ValueError):
+        acc + AcumuladorTheta()
@@ -0,0 +1,76 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.theta import calcular_theta_corpus, escanear_corpus, rangos_por_linea
+
+FRAGMENTOS = ["Model A", "MODEL B", "unknown", "neutral", "ñandú", "  ", "x"]
+
+
+def _escribir(tmp_path, lineas, salto="\n", final=True):
+    ruta = tmp_path / "corpus.txt"
+    texto = salto.join(lineas) + (salto if final and lineas else "")
+    ruta.write_bytes(texto.encode("utf-8"))
+    return str(ruta)
+
+
+def _lineas(semilla, n=300, unknown=True):
+    rng = random.Random(semilla)
+    frag = FRAGMENTOS if unknown else [f for f in FRAGMENTOS if f != "unknown"]
+    return [" ".join(rng.choice(frag) for _ in range(rng.randint(0, 4))) for _ in range(n)]
+
+
+@pytest.mark.parametrize("salto", ["\n", "\r\n"])
+@pytest.mark.parametrize("final", [True, False])
+@pytest.mark.parametrize("unknown", [True, False])
+def test_equivale_a_calcular_theta_sobre_lineas(tmp_path, salto, final, unknown):
+    ruta = _escribir(tmp_path, _lineas(1, unknown=unknown), salto, final)
+    with open(ruta, encoding="utf-8") as f:
+        esperado = core.calcular_theta(f.read().splitlines())
+    for tam in (1, 17, 4096):
+        assert calcular_theta_corpus(ruta, ejecutor="inline", max_workers=3, tam_rango=tam) == esperado
+
+
+def test_rangos_cubren_el_archivo_en_limites_de_linea(tmp_path):
+    ruta = _escribir(tmp_path, _lineas(2), final=False)
+    datos = open(ruta, "rb").read()
+    rangos = rangos_por_linea(ruta, partes=7)
+    assert rangos[0][0] == 0 and rangos[-1][1] == len(datos)
+    for (_, fin), (inicio, _) in zip(rangos, rangos[1:]):
+        assert fin == inicio and datos[fin - 1:fin] == b"\n"
+    # tam_max acota cada rango salvo la cola de la línea en la que cae el corte
+    linea_max = max(len(l) + 1 for l in datos.split(b"\n"))
+    assert all(fin - inicio < 64 + linea_max for inicio, fin in rangos_por_linea(ruta, partes=1, tam_max=64))
+
+
+def test_procesos_hilos_y_executor(tmp_path):
+    ruta = _escribir(tmp_path, _lineas(3, n=2000, unknown=False) + ["Model A", "Model B"])
+    esperado = escanear_corpus(ruta, ejecutor="inline")
+    for ejecutor in ("procesos", "hilos"):
+        res = escanear_corpus(ruta, ejecutor=ejecutor, max_workers=2, tam_rango=1024)
+        assert (res.n, res.desconocidas, res.mascara) == (esperado.n, esperado.desconocidas, esperado.mascara)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert escanear_corpus(ruta, ejecutor=pool, tam_rango=512).theta == esperado.theta == 1.0
+
+
+def test_corpus_vacio_y_marcadores_propios(tmp_path):
+    vacio = tmp_path / "vacio.txt"
+    vacio.write_bytes(b"")
+    assert rangos_por_linea(str(vacio), 4) == []
+    assert calcular_theta_corpus(str(vacio), ejecutor="inline") == 0.0
+    ruta = _escribir(tmp_path, ["n/d", "ok", "ok"])
+    propios = core.MarcadoresTheta(desconocido=("n/d",))
+    assert calcular_theta_corpus(ruta, marcadores=propios, ejecutor="inline") == pytest.approx(1 / 3)
+
+
+def test_ejecutor_desconocido(tmp_path):
+    with pytest.raises(ValueError):
+        escanear_corpus(_escribir(tmp_path, ["a"]), ejecutor="gpu")
+
+
+def test_solo_lf_separa_premisas(tmp_path):
+    # "\r" suelto no parte la línea (a diferencia de str.splitlines())
+    ruta = _escribir(tmp_path, ["unknown\rok", "ok"])
+    assert escanear_corpus(ruta, ejecutor="inline").n == 2
+    assert calcular_theta_corpus(ruta, ejecutor="inline") == 0.5
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega.core import MarcadoresTheta, calcular_theta
+
+
+def _theta_referencia(cluster):
+    """Implementación original (tres barridos sobre textos en minúscula)."""
+    if not cluster:
+        return 0.0
+    texts = [str(x).lower().strip() for x in cluster]
+    unknowns = sum(1 for t in texts if "unknown" in t)
+    if unknowns > 0:
+        return core.clamp(unknowns / len(cluster), 0.0, 1.0)
+    if len(cluster) < 6:
+        return 0.0
+    if any("model a" in t for t in texts) and any("model b" in t for t in texts):
+        return 1.0
+    return core.THETA_BASE
+
+
+FRAGMENTOS = ["Model A", "MODEL B", "model  a", "UnKnown", "known", "model", "  ", "a", "b", 42, None, "modeL A is fine"]
+
+
+def test_equivalencia_con_la_referencia():
+    rng = random.Random(11)
+    for _ in range(500):
+        cluster = [
+            " ".join(str(rng.choice(FRAGMENTOS)) for _ in range(rng.randint(0, 4)))
+            for _ in range(rng.randint(0, 12))
+        ]
+        assert calcular_theta(cluster) == _theta_referencia(cluster)
+
+
+def test_casos_clasicos():
+    conflicto = ["Model A ok", "follow Model B"] + ["neutral"] * 4
+    assert calcular_theta(conflicto) == 1.0
+    assert calcular_theta(conflicto[:5]) == 0.0
+    assert calcular_theta(["unknown", "x"]) == 0.5
+    assert calcular_theta(["neutral"] * 6) == core.THETA_BASE
+    assert calcular_theta([]) == 0.0
+
+
+def test_acepta_generadores():
+    cluster = ["Model A"] * 3 + ["Model B"] * 3
+    assert calcular_theta(x for x in cluster) == 1.0
+    assert calcular_theta(x for x in ()) == 0.0
+
+
+def test_marcadores_configurables():
+    marcadores = MarcadoresTheta(desconocido=("N/D", "??"), conflicto=("Política X", "Política Y", "Política Z"))
+    base = ["política x", "POLÍTICA Y", "neutral", "neutral", "neutral", "neutral"]
+    assert calcular_theta(base, marcadores) == core.THETA_BASE
+    assert calcular_theta(base + ["política z"], marcadores) == 1.0
+    assert calcular_theta(["valor n/d", "ok", "¿??"], marcadores) == pytest.approx(2 / 3)
+    # "unknown" deja de ser marcador con un conjunto propio
+    assert calcular_theta(["unknown"] * 6, marcadores) == core.THETA_BASE
+
+
+def test_marcadores_con_espacios_en_los_bordes_respetan_strip():
+    marcadores = MarcadoresTheta(desconocido=(" fin",), conflicto=())
+    assert calcular_theta([" fin del texto"], marcadores) == 0.0  # strip() quita el espacio inicial
+    assert calcular_theta(["el fin"], marcadores) == core.clamp(1.0, 0.0, 1.0)
+
+
+def test_sin_conflicto_configurado_nunca_dispara():
+    assert calcular_theta(["model a", "model b"] * 3, MarcadoresTheta(conflicto=())) == core.THETA_BASE
+
+
+def test_marcador_vacio_invalido():
+    with pytest.raises(ValueError):
+        MarcadoresTheta(desconocido=("",))
+
+
+def test_escanear_exhaustivo():
+    cluster = ["unknown", "model a", "model b"]
+    assert core.MARCADORES_THETA.escanear(cluster) == (3, 1, True)
+    n, desconocidas, _ = core.MARCADORES_THETA.escanear(cluster, exhaustivo=False)
+    assert (n, desconocidas) == (3, 1)
@@ -0,0 +1,67 @@
+import array
+import random
+
+import pytest
+from villasmil_omega import core
+from villasmil_omega import theta as theta_mod
+from villasmil_omega.theta import AcumuladorTheta, matriz_theta, pares_theta, resumir_clusters
+
+FRAGMENTOS = ["Model A", "MODEL B", "unknown", "neutral", "x"]
+
+
+def _clusters(semilla, n=25):
+    rng = random.Random(semilla)
+    clusters = []
+    for _ in range(n):
+        pesos = [rng.random() for _ in FRAGMENTOS]
+        pesos[2] *= rng.choice([0.0, 0.2])
+        clusters.append(rng.choices(FRAGMENTOS, weights=pesos, k=rng.randint(0, 8)))
+    return clusters
+
+
+def _esperada(clusters):
+    return [[core.theta_for_two_clusters(a, b)["theta_combined"] for b in clusters] for a in clusters]
+
+
+@pytest.mark.parametrize("bloque", [1, 7, 256])
+def test_matriz_equivale_a_pares(monkeypatch, bloque):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(theta_mod, "FILAS_POR_BLOQUE", bloque)
+    clusters = _clusters(1)
+    M = matriz_theta(resumir_clusters(clusters))
+    assert isinstance(M, np.ndarray) and M.dtype == np.float64
+    assert M.tolist() == _esperada(clusters)
+
+
+def test_matriz_sin_numpy(monkeypatch):
+    clusters = _clusters(2, n=10)
+    monkeypatch.setattr(core, "_np", None)
+    M = matriz_theta(resumir_clusters(clusters))
+    assert all(isinstance(fila, array.array) for fila in M)
+    assert [list(fila) for fila in M] == _esperada(clusters)
+
+
+@pytest.mark.parametrize("sin_numpy", [False, True])
+@pytest.mark.parametrize("umbral", [0.0, core.THETA_BASE, 0.3, 0.99])
+def test_pares_por_encima_del_umbral(monkeypatch, sin_numpy, umbral):
+    if sin_numpy:
+        monkeypatch.setattr(core, "_np", None)
+    else:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(theta_mod, "FILAS_POR_BLOQUE", 4)
+    clusters = _clusters(3)
+    esperada = _esperada(clusters)
+    pares = pares_theta(resumir_clusters(clusters), umbral)
+    assert pares == [
+        (i, j, esperada[i][j])
+        for i in range(len(clusters)) for j in range(i + 1, len(clusters))
+        if esperada[i][j] > umbral
+    ]
+
+
+def test_vacio_y_marcadores_mezclados():
+    assert pares_theta([], 0.5) == []
+    assert len(matriz_theta([])) == 0
+    propios = core.MarcadoresTheta(conflicto=("x",))
+    with pytest.raises(ValueError):
+        matriz_theta([AcumuladorTheta(), AcumuladorTheta(propios)])
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from villasmil_omega.cierre.invariancia import Invariancia
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+from villasmil_omega.cierre.invariancia import Invariancia, InvarianciaIncremental
 
 @dataclass
 class CierreSistema:
@@ -9,3 +10,70 @@ class CierreSistema:
     def evaluar(self) -> bool:
         """El cierre no es ganar, es dejar de gastar energía."""
         return self.invariancia.es_invariante(self.historial_score)
+
+
+@dataclass
+class CierreIncremental:
+    """
+    Cierre dirigido por eventos: recibe los scores según llegan (`agregar`) con
+    estado O(ventana) y, en cuanto se alcanza la invariancia, marca la sesión
+    como cerrada y dispara una sola vez los callbacks suscritos — sin sondeo.
+    Si alguno falla, los demás se invocan igualmente y después se relanza el
+    primer error.
+    """
+    invariancia: Invariancia
+    al_cerrar: Optional[Callable[["CierreIncremental"], Any]] = None
+    cerrado: bool = field(default=False, init=False)
+    muestras: int = field(default=0, init=False)
+    _guardian: InvarianciaIncremental = field(init=False, repr=False)
+    _callbacks: List[Callable[["CierreIncremental"], Any]] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        self._guardian = InvarianciaIncremental.desde(self.invariancia)
+        if self.al_cerrar is not None:
+            self._callbacks.append(self.al_cerrar)
+
+    def suscribir(self, callback: Callable[["CierreIncremental"], Any]) -> None:
+        """Registra `callback(cierre)`; si la sesión ya cerró se invoca de inmediato."""
+        self._callbacks.append(callback)
+        if self.cerrado:
+            callback(self)
+
+    def agregar(self, score: float) -> bool:
+        """
+        Añade un score y retorna si la sesión está cerrada. Equivale a
+        `CierreSistema(invariancia, scores_hasta_ahora).evaluar()` hasta el
+        cierre; después los scores se ignoran y retorna True.
+        """
+        if self.cerrado:
+            return True
+        self.muestras += 1
+        if not self._guardian.push(score):
+            return False
+        # Se marca antes de notificar: un callback que falle (o que vuelva a
+        # llamar a `agregar`) no provoca un segundo disparo.
+        self.cerrado = True
+        errores = []
+        for callback in list(self._callbacks):
+            try:
+                callback(self)
+            except Exception as exc:
+                errores.append(exc)
+        if errores:
+            # Todos los suscriptores ya fueron notificados: se relanza el primer
+            # error con los siguientes encadenados como contexto.
+            for error, siguiente in zip(errores, errores[1:]):
+                if error.__context__ is None:
+                    error.__context__ = siguiente
+            raise errores[0]
+        return True
+
+    def evaluar(self) -> bool:
+        """Mismo contrato que `CierreSistema.evaluar`, sin re-escanear el historial."""
+        return self.cerrado
+
+    def reiniciar(self) -> None:
+        """Reabre la sesión (conserva los callbacks) para reutilizar el objeto."""
+        self._guardian.reiniciar()
+        self.cerrado = False
+        self.muestras = 0
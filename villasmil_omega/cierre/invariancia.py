@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import List
+import mmap
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Tuple
 
 @dataclass
 class Invariancia:
@@ -29,3 +31,108 @@ class Invariancia:
         # Rama 4: Éxito de invariancia.
         # Todo el historial reciente está en calma.
         return True
+
+    def segmentos_paz(self, historial: Iterable[float]) -> List[Tuple[int, int]]:
+        """
+        Auditoría: todos los tramos (inicio, fin), índices inclusivos, en los que
+        `es_invariante(historial[:k + 1])` es True para cada k del tramo.
+        Una sola pasada O(n) con `InvarianciaIncremental` (sin re-evaluar cada
+        prefijo); acepta listas, ndarray, array.array, memoryview y `mmap.mmap`
+        (leído como float64 nativo, como `flujo.mapear_float64`).
+        """
+        guardian = InvarianciaIncremental.desde(self)
+        segmentos: List[Tuple[int, int]] = []
+        inicio = -1
+        k = -1
+        for k, v in enumerate(_iterar_muestras(historial)):
+            if guardian.push(v):
+                if inicio < 0:
+                    inicio = k
+            elif inicio >= 0:
+                segmentos.append((inicio, k - 1))
+                inicio = -1
+        if inicio >= 0:
+            segmentos.append((inicio, k))
+        return segmentos
+
+
+@dataclass
+class InvarianciaIncremental:
+    epsilon: float = 1e-3
+    ventana: int = 5
+    _n: int = field(default=0, init=False, repr=False)
+    _maximos: deque = field(default_factory=deque, init=False, repr=False)
+    _minimos: deque = field(default_factory=deque, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.ventana < 1:
+            raise ValueError("ventana debe ser >= 1")
+
+    @classmethod
+    def desde(cls, invariancia: Invariancia) -> "InvarianciaIncremental":
+        """Guardián incremental con los mismos epsilon/ventana que `invariancia`."""
+        return cls(epsilon=invariancia.epsilon, ventana=invariancia.ventana)
+
+    def push(self, valor: float) -> bool:
+        """
+        Añade una muestra y retorna lo mismo que `Invariancia.es_invariante`
+        sobre el historial completo visto hasta ahora, en O(1) amortizado.
+        Deques monótonas de (índice, valor) dan el máximo y el mínimo de la
+        ventana: |v - base| <= epsilon para toda v  ⇔  max - base <= epsilon y
+        base - min <= epsilon.
+        """
+        i = self._n
+        self._n += 1
+
+        # NaN nunca rompe la paz en es_invariante (toda comparación es False):
+        # no entra en las deques pero sí ocupa su posición en la ventana.
+        if valor == valor:
+            while self._maximos and self._maximos[-1][1] <= valor:
+                self._maximos.pop()
+            self._maximos.append((i, valor))
+            while self._minimos and self._minimos[-1][1] >= valor:
+                self._minimos.pop()
+            self._minimos.append((i, valor))
+
+        limite = i - self.ventana
+        while self._maximos and self._maximos[0][0] <= limite:
+            self._maximos.popleft()
+        while self._minimos and self._minimos[0][0] <= limite:
+            self._minimos.popleft()
+
+        # Rama 1: Ventana insuficiente
+        if self._n < self.ventana:
+            return False
+
+        base = valor
+        # Rama 2/3: ruptura si el extremo de la ventana escapa del épsilon
+        if self._maximos and self._maximos[0][1] - base > self.epsilon:
+            return False
+        if self._minimos and base - self._minimos[0][1] > self.epsilon:
+            return False
+        # Rama 4: Éxito de invariancia
+        return True
+
+    def reiniciar(self) -> None:
+        self._n = 0
+        self._maximos.clear()
+        self._minimos.clear()
+
+
+def _iterar_muestras(historial: Any, bloque: int = 65536) -> Iterator[float]:
+    """
+    Itera muestras como floats de Python. Las fuentes con `tolist` y slicing
+    (ndarray, array.array, memoryview de un mmap) se recorren por bloques para
+    no materializar el archivo completo ni iterar escalares NumPy. Un
+    `mmap.mmap` crudo se lee como float64 nativo (iterarlo daría bytes sueltos).
+    """
+    if isinstance(historial, mmap.mmap):
+        # La vista se libera al terminar para que el llamador pueda cerrar el mmap
+        with memoryview(historial) as crudo, crudo.cast("d") as vista:
+            yield from _iterar_muestras(vista, bloque)
+        return
+    if hasattr(historial, "tolist") and hasattr(historial, "__getitem__") and hasattr(historial, "__len__"):
+        for i in range(0, len(historial), bloque):
+            yield from historial[i:i + bloque].tolist()
+    else:
+        yield from historial
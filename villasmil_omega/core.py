@@ -4,8 +4,20 @@ Certificación: SIL-4 | Grado Militar | Anti-Crash Ingestion
 Cambios: Restauración del orden L1 -> L2 (invariancia antes de meta/force),
          ingestión robusta, saneamiento NaN/Inf, compatibilidad hacia atrás.
 """
+import array
 import math
-from typing import List, Dict, Any, Tuple, Optional
+import threading
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Tuple, Optional, Callable, Hashable, Iterable
+
+# NumPy es opcional: habilita la ingestión vectorizada (modo="vectorizado").
+# Sin NumPy el camino escalar sigue disponible y es el usado por defecto.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+from villasmil_omega.resultados import ResultadoFlujo, FLUJO_PAZ, FLUJO_EVOLVING, FLUJO_BASAL
 
 # Fallback seguro para entornos de test/packaging donde el módulo cierre.invariancia
 # podría no estar disponible durante desarrollo ligero.
@@ -34,17 +46,141 @@ EPS = 1e-9
 # ════════════════���════════════════════════════════════════════════════════==
 guardian_paz = Invariancia(epsilon=EPSILON_PAZ, ventana=VENTANA_HISTORIA)
 
-def verificar_invariancia(historial: List[float]) -> bool:
-    """Verifica invariancia (L1)."""
+class RegistroGuardianes:
+    """
+    Guardianes L1 por stream / tenant, seguros entre hilos y con desalojo LRU.
+    - max_guardianes: guardianes vivos; al superarlo se desaloja el menos usado.
+    - epsilon / ventana: parámetros por defecto de cada guardián nuevo.
+    - fabrica: constructor del guardián (por defecto `Invariancia`).
+    La configuración por clave (`configurar`) sobrevive al desalojo: el
+    guardián se recrea con ella en el siguiente acceso.
+    """
+
+    def __init__(
+        self,
+        max_guardianes: int = 1024,
+        epsilon: float = EPSILON_PAZ,
+        ventana: int = VENTANA_HISTORIA,
+        fabrica: Callable[..., Any] = None
+    ):
+        if max_guardianes < 1:
+            raise ValueError("max_guardianes debe ser >= 1")
+        self.max_guardianes = max_guardianes
+        self.epsilon = epsilon
+        self.ventana = ventana
+        self.fabrica = fabrica if fabrica is not None else Invariancia
+        self._guardianes: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._config: Dict[Hashable, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def configurar(self, clave: Hashable, epsilon: Optional[float] = None, ventana: Optional[int] = None) -> None:
+        """Fija epsilon/ventana propios para `clave` (reemplaza su guardián actual)."""
+        with self._lock:
+            config = self._config.setdefault(clave, {})
+            if epsilon is not None:
+                config["epsilon"] = epsilon
+            if ventana is not None:
+                config["ventana"] = ventana
+            self._guardianes.pop(clave, None)
+
+    def obtener(self, clave: Hashable) -> Any:
+        """Guardián de `clave`; lo crea si no existe y lo marca como recién usado."""
+        with self._lock:
+            guardian = self._guardianes.get(clave)
+            if guardian is not None:
+                self._guardianes.move_to_end(clave)
+                return guardian
+            config = self._config.get(clave, {})
+            guardian = self.fabrica(
+                epsilon=config.get("epsilon", self.epsilon),
+                ventana=config.get("ventana", self.ventana)
+            )
+            self._guardianes[clave] = guardian
+            if len(self._guardianes) > self.max_guardianes:
+                self._guardianes.popitem(last=False)
+            return guardian
+
+    def eliminar(self, clave: Hashable) -> None:
+        """Olvida el guardián y la configuración de `clave`."""
+        with self._lock:
+            self._guardianes.pop(clave, None)
+            self._config.pop(clave, None)
+
+    def __len__(self) -> int:
+        return len(self._guardianes)
+
+    def __contains__(self, clave: Hashable) -> bool:
+        return clave in self._guardianes
+
+registro_guardianes = RegistroGuardianes()
+
+def _guardian(clave_flujo: Optional[Hashable] = None) -> Any:
+    """Guardián global (`guardian_paz`) o el del stream `clave_flujo`."""
+    return guardian_paz if clave_flujo is None else registro_guardianes.obtener(clave_flujo)
+
+def verificar_invariancia(historial: List[float], clave_flujo: Optional[Hashable] = None) -> bool:
+    """Verifica invariancia (L1), con el guardián global o el del stream `clave_flujo`."""
+    return _verificar_con(_guardian(clave_flujo), historial)
+
+def _verificar_con(guardian: Any, historial: List[float]) -> bool:
     try:
-        return guardian_paz.es_invariante(historial)
+        return guardian.es_invariante(historial)
     except Exception:
         # En caso de error en el guardián, no bloquear el flujo — preferimos seguridad por defecto.
         return False
 
+def _ventana_guardian(guardian: Any = None) -> Optional[int]:
+    """
+    Ventana del guardián L1 (global si `guardian` es None) si es un entero
+    positivo; None si no se conoce (p.ej. guardián fallback), en cuyo caso
+    hace falta el historial completo.
+    """
+    ventana = getattr(guardian_paz if guardian is None else guardian, "ventana", None)
+    if isinstance(ventana, int) and ventana > 0:
+        return ventana
+    return None
+
 # ══════════════════════════════���══════════════════════════════════════════==
 # UTILIDADES BÁSICAS Y PROTECCIONES
 # ═════════════════════════════════════════════════════════════════════════==
+# Tipos para los que float() siempre lanza: se descartan sin try/except. Es fijo:
+# un tipo desconocido pasa siempre por float() con try, para que el resultado no
+# dependa de entradas anteriores.
+_TIPOS_NO_NUMERICOS = frozenset({type(None), dict, list, tuple, set, frozenset, complex})
+# Primer carácter (tras espacios) posible de un texto que float() acepta
+_INICIO_NUMERICO = frozenset("+-.iInN0123456789")
+
+def _a_float(x: Any) -> Optional[float]:
+    """
+    float(x), o None si no es convertible, clasificando por tipo: los floats e
+    ints pasan directo, los tipos no numéricos se rechazan sin excepción y sólo
+    el texto con pinta numérica (o tipos desconocidos) pasa por float() con try.
+    """
+    t = type(x)
+    if t is float:
+        return x
+    if t is int or t is bool:
+        try:
+            return float(x)
+        except OverflowError:
+            return None
+    if t in _TIPOS_NO_NUMERICOS:
+        return None
+    if t is str:
+        inicio = x[:1]
+        if inicio.isspace():
+            inicio = x.lstrip()[:1]
+        if not (inicio in _INICIO_NUMERICO or inicio.isdecimal()):
+            return None
+        try:
+            return float(x)
+        except ValueError:
+            return None
+    try:
+        return float(x)
+    except Exception:
+        return None
+
 def _is_finite_number(x: Any) -> bool:
     try:
         return isinstance(x, (int, float)) and math.isfinite(float(x))
@@ -56,11 +192,8 @@ def clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
     Clamp con protección OMEGA_U y manejo de no-finite.
     Si `value` no es finito, retorna el mínimo permitido para evitar NaNs.
     """
-    try:
-        v = float(value)
-    except Exception:
-        return max(0.0, float(min_val))
-    if not math.isfinite(v):
+    v = value if type(value) is float else _a_float(value)
+    if v is None or not math.isfinite(v):
         return max(0.0, float(min_val))
     v_min = max(0.0, float(min_val))
     v_max = min(float(max_val), OMEGA_U)
@@ -72,22 +205,14 @@ def suma_omega(a: float, b: float) -> float:
     - Si ambos operandos están en rango [-1.01, 1.01], aplica saturación en OMEGA_U.
     - Si algún valor no es finito, se ignora en la suma (seguridad).
     """
-    try:
-        a_f = float(a)
-        b_f = float(b)
-    except Exception:
-        # Si no son convertibles, fallback a suma de los que sean convertibles
-        vals = []
-        for v in (a, b):
-            try:
-                fv = float(v)
-                if math.isfinite(fv):
-                    vals.append(fv)
-            except Exception:
-                continue
-        if not vals:
+    a_f = _a_float(a)
+    b_f = _a_float(b)
+    if a_f is None or b_f is None:
+        # Si no son convertibles, fallback al operando convertible (si es finito)
+        v = b_f if a_f is None else a_f
+        if v is None or not math.isfinite(v):
             return 0.0
-        return sum(vals)
+        return 0.0 + v
 
     if not (math.isfinite(a_f) and math.isfinite(b_f)):
         vals = [v for v in (a_f, b_f) if math.isfinite(v)]
@@ -98,6 +223,50 @@ def suma_omega(a: float, b: float) -> float:
         return min(resultado, OMEGA_U)
     return resultado
 
+# ═════════════════════════════════════════════════════════════════════════==
+# INGESTIÓN VECTORIZADA (NumPy opcional)
+# ═════════════════════════════════════════════════════════════════════════==
+def _como_array(data: Any) -> Optional[Any]:
+    """
+    Convierte `data` a ndarray float64 1-D si es numérico homogéneo. Las fuentes
+    buffer-protocol float64 (array('d'), memoryview, ndarray) se envuelven sin copia.
+    Retorna None (→ camino escalar) si no hay NumPy o si los datos contienen
+    strings, objetos o estructuras anidadas: su semántica float() se preserva.
+    """
+    if _np is None:
+        return None
+    try:
+        arr = _np.asarray(data)
+    except Exception:
+        return None
+    if arr.ndim != 1 or arr.dtype.kind not in "biuf":
+        return None
+    return arr.astype(_np.float64, copy=False)
+
+def _es_fuente_array(data: Any) -> bool:
+    """ndarray o fuente buffer-protocol tipada (array.array, memoryview): NumPy la lee sin copia."""
+    return _np is not None and isinstance(data, (_np.ndarray, array.array, memoryview))
+
+def _sanear_vectorizado(arr: Any) -> Any:
+    """Máscara de finitos + clamp [0, min(1, OMEGA_U)], equivalente a `clamp(v, 0.0, 1.0)`."""
+    return _np.clip(arr[_np.isfinite(arr)], 0.0, min(1.0, OMEGA_U))
+
+def _ritmo_vectorizado(saneado: Any, c: float) -> float:
+    """calcular_raiz_ritmo sobre datos ya saneados; misma suma fsum que el camino escalar."""
+    if saneado.size < 2:
+        return OMEGA_U
+    return _ritmo_desde_suma(math.fsum(_np.square(saneado - c).tolist()), int(saneado.size), c)
+
+def _cola_invariancia(saneado: Any, guardian: Any = None) -> List[float]:
+    """
+    Cola suficiente para el guardián L1: `es_invariante` sólo mira las últimas
+    `ventana` muestras (y exige len >= ventana), así que basta con esa cola.
+    """
+    ventana = _ventana_guardian(guardian)
+    if ventana is not None:
+        return saneado[-ventana:].tolist()
+    return saneado.tolist()
+
 # ═════════════════════════════════════════════════════════════════════════==
 # L3 - RAÍZ DE RITMO (Metrónomo)
 # ═════════════════════════════════════════════════════════════════════════==
@@ -105,30 +274,32 @@ def calcular_raiz_ritmo(historial: List[float], centro: Optional[float] = None)
     """
     L3 - Metrónomo. Índice de estabilidad basado en RMSE normalizado con raíz.
     - historial: lista de valores (esperados en escala [0,1]; la función sanitiza).
+      También acepta ndarray, array.array y memoryview (vectorizado sin copia si hay NumPy).
     - centro: valor objetivo; si None, se usa C_MAX / 2.
     Retorna índice en [0, OMEGA_U].
     """
+    c = centro if centro is not None else (C_MAX / 2.0)
+
+    if _es_fuente_array(historial):
+        arr = _como_array(historial)
+        if arr is not None:
+            return _ritmo_vectorizado(_sanear_vectorizado(arr), c)
+        historial = historial.tolist()
+
     if not historial or len(historial) < 2:
         return OMEGA_U
 
-    c = centro if centro is not None else (C_MAX / 2.0)
-
     # Sanitización: mantener sólo valores finitos y en rango, y clamp cada valor
-    h_saneado = []
-    for x in historial:
-        try:
-            v = float(x)
-            if not math.isfinite(v):
-                continue
-            h_saneado.append(clamp(v, 0.0, 1.0))
-        except Exception:
-            continue
+    h_saneado = _sanear_escalar(historial)
 
-    if not h_saneado or len(h_saneado) < 2:
-        return OMEGA_U
+    # fsum: suma correctamente redondeada, idéntica entre camino escalar y vectorizado
+    return _ritmo_desde_suma(math.fsum((x - c) ** 2 for x in h_saneado), len(h_saneado), c)
 
-    suma_cuadrados = sum((x - c) ** 2 for x in h_saneado)
-    rmse = math.sqrt(suma_cuadrados / len(h_saneado))
+def _ritmo_desde_suma(suma_cuadrados: float, n: int, c: float) -> float:
+    """Índice L3 a partir de n y la suma de cuadrados de desviaciones respecto a `c`."""
+    if n < 2:
+        return OMEGA_U
+    rmse = math.sqrt(suma_cuadrados / n)
 
     max_dev = max(abs(c - 0.0), abs(1.0 - c), EPS)
     dev_norm = clamp(rmse / max_dev, 0.0, 1.0)
@@ -148,9 +319,11 @@ def indice_mc(*args) -> float:
         return 0.0
 
     if len(args) >= 2:
+        a = _a_float(args[0])
+        b = _a_float(args[1])
+        if a is None or b is None:
+            return 0.0
         try:
-            a = float(args[0])
-            b = float(args[1])
             total = a + b
             return clamp(a / total, 0.0, C_MAX) if total > 0 else 0.0
         except Exception:
@@ -158,14 +331,17 @@ def indice_mc(*args) -> float:
 
     data = args[0]
     if isinstance(data, list):
-        try:
-            return clamp(sum(float(x) for x in data) / len(data), 0.0, C_MAX) if data else 0.0
-        except Exception:
+        if not data:
             return 0.0
-    try:
-        return clamp(float(data), 0.0, C_MAX)
-    except Exception:
-        return 0.0
+        valores = []
+        for x in data:
+            v = _a_float(x)
+            if v is None:
+                return 0.0
+            valores.append(v)
+        return clamp(sum(valores) / len(data), 0.0, C_MAX)
+    v = _a_float(data)
+    return clamp(v, 0.0, C_MAX) if v is not None else 0.0
 
 def indice_ci(*args, **kwargs) -> float:
     """
@@ -206,54 +382,385 @@ def ajustar_mc_ci_por_coherencia(mc_base: float, ci_base: float, res_coherencia:
 # ═════════════════════════════════════════════════════════════════════════==
 # L3 - TENSION GLOBAL (THETA) + compatibilidades
 # ═════════════════════════════════════════════════════════════════════════==
-def calcular_theta(cluster: List[Any]) -> float:
-    """Detector de Tensión Global y Conflicto A2.2."""
-    if not cluster:
+class MarcadoresTheta:
+    """
+    Marcadores A2.2 normalizados una sola vez.
+    - desconocido: una premisa cuenta como desconocida si contiene alguno.
+    - conflicto: hay conflicto si cada marcador aparece en alguna premisa del cluster.
+    - max_prefijo / max_sufijo: modo acotado; de cada premisa sólo se
+      inspeccionan los primeros `max_prefijo` caracteres y los últimos
+      `max_sufijo`, así el coste y la memoria por premisa quedan topados ante
+      textos gigantes. El texto se recorta antes de convertirlo; los
+      contenedores (list, tuple, dict, set, deque y subclases) se representan
+      de forma abreviada en lugar de con `str()` completo, y una conversión que
+      falle cuenta como texto vacío. Un marcador que sólo aparezca fuera de
+      esa ventana no se detecta.
+    `escanear` recorre el cluster en una sola pasada, sin lista intermedia de
+    textos; los marcadores de conflicto ya hallados dejan de buscarse.
+    """
+    __slots__ = ("desconocido", "conflicto", "completa", "max_prefijo", "max_sufijo", "_recortar")
+
+    def __init__(
+        self,
+        desconocido: Tuple[str, ...] = ("unknown",),
+        conflicto: Tuple[str, ...] = ("model a", "model b"),
+        max_prefijo: Optional[int] = None,
+        max_sufijo: int = 0
+    ):
+        if max_prefijo is not None and max_prefijo < 1:
+            raise ValueError("max_prefijo debe ser >= 1 o None")
+        if max_sufijo < 0 or (max_sufijo and max_prefijo is None):
+            raise ValueError("max_sufijo debe ser >= 0 y requiere max_prefijo")
+        self.max_prefijo = max_prefijo
+        self.max_sufijo = max_sufijo
+        self.desconocido = tuple(dict.fromkeys(str(m).lower() for m in desconocido))
+        self.conflicto = tuple(dict.fromkeys(str(m).lower() for m in conflicto))
+        if not all(self.desconocido + self.conflicto):
+            raise ValueError("los marcadores no pueden ser cadenas vacías")
+        # Máscara con un bit por marcador de conflicto: todos vistos = conflicto
+        self.completa = (1 << len(self.conflicto)) - 1
+        # strip() sólo cambia el resultado si algún marcador empieza o termina en espacio
+        self._recortar = any(m != m.strip() for m in self.desconocido + self.conflicto)
+
+    def __eq__(self, otro: Any) -> bool:
+        if not isinstance(otro, MarcadoresTheta):
+            return NotImplemented
+        return self._clave() == otro._clave()
+
+    def __hash__(self) -> int:
+        return hash(self._clave())
+
+    def _clave(self) -> Tuple[Any, ...]:
+        return (self.desconocido, self.conflicto, self.max_prefijo, self.max_sufijo)
+
+    def normalizar(self, premisa: Any) -> str:
+        if self.max_prefijo is None:
+            texto = (premisa if type(premisa) is str else str(premisa)).lower()
+        else:
+            texto = self._ventana(self._texto_acotado(premisa)).lower()
+        return texto.strip() if self._recortar else texto
+
+    def _texto_acotado(self, premisa: Any) -> str:
+        """Texto de la premisa sin convertir por completo objetos enormes."""
+        limite = self.max_prefijo + self.max_sufijo
+        if isinstance(premisa, str):
+            # Recorte primero; str.__str__ da un str plano también para subclases
+            return str.__str__(self._ventana(premisa))
+        if isinstance(premisa, (bytes, bytearray)):
+            return str(bytes(premisa[:limite]))
+        if isinstance(premisa, _CONTENEDORES):
+            return _repr_acotado(premisa, limite)
+        try:
+            return str(premisa)
+        except Exception:
+            # p.ej. int con más dígitos que el límite de conversión a str
+            return ""
+
+    def _ventana(self, texto: str) -> str:
+        """Prefijo (y sufijo) acotado; un separador evita que un marcador una ambas partes."""
+        p, q = self.max_prefijo, self.max_sufijo
+        if len(texto) <= p + q:
+            return texto
+        if not q:
+            return texto[:p]
+        return texto[:p] + "\x00" + texto[-q:]
+
+    def es_desconocida(self, texto: str) -> bool:
+        """¿El texto normalizado contiene algún marcador desconocido?"""
+        return any(m in texto for m in self.desconocido)
+
+    def mascara(self, texto: str) -> int:
+        """Bits de los marcadores de conflicto presentes en el texto normalizado."""
+        return sum(1 << i for i, m in enumerate(self.conflicto) if m in texto)
+
+    def es_conflicto(self, mascara: int) -> bool:
+        return bool(self.conflicto) and mascara == self.completa
+
+    def escanear(self, cluster: Iterable[Any], exhaustivo: bool = True) -> Tuple[int, int, bool]:
+        """
+        (premisas, premisas desconocidas, conflicto) en una sola pasada.
+        Con exhaustivo=False deja de buscar conflicto tras la primera premisa
+        desconocida (a `calcular_theta` ya no le importa); el flag de conflicto
+        retornado sólo es fiable si no hubo desconocidas.
+        """
+        n, desconocidas, mascara = self.resumir(cluster, exhaustivo)
+        return n, desconocidas, self.es_conflicto(mascara)
+
+    def resumir(self, cluster: Iterable[Any], exhaustivo: bool = True) -> Tuple[int, int, int]:
+        """Como `escanear`, pero con la máscara de conflicto (combinable con OR)."""
+        n = 0
+        desconocidas = 0
+        mascara = 0
+        pendientes = list(enumerate(self.conflicto))
+        unico = self.desconocido[0] if len(self.desconocido) == 1 else None
+        for premisa in cluster:
+            n += 1
+            texto = self.normalizar(premisa)
+            if unico is not None:
+                if unico in texto:
+                    desconocidas += 1
+            elif self.es_desconocida(texto):
+                desconocidas += 1
+            if desconocidas and not exhaustivo:
+                pendientes = None
+            elif pendientes:
+                for _, m in pendientes:
+                    if m in texto:
+                        # Se buscan sólo los marcadores aún no vistos
+                        vistos = [(i, p) for i, p in pendientes if p in texto]
+                        mascara |= sum(1 << i for i, _ in vistos)
+                        pendientes = [ip for ip in pendientes if ip not in vistos]
+                        break
+        return n, desconocidas, mascara
+
+_CONTENEDORES = (list, tuple, dict, set, frozenset, deque)
+
+def _repr_acotado(obj: Any, limite: int, nivel: int = 0) -> str:
+    """
+    Representación abreviada de `obj` (prefijo aproximado de su repr) que nunca
+    recorre más elementos ni caracteres de los necesarios para `limite`.
+    """
+    if isinstance(obj, str):
+        return repr(str.__str__(obj[:limite]))
+    if isinstance(obj, (bytes, bytearray)):
+        return repr(bytes(obj[:limite]))
+    if isinstance(obj, _CONTENEDORES):
+        if nivel >= 4:
+            return "..."
+        es_dict = isinstance(obj, dict)
+        abre, cierra = ("{", "}") if es_dict or isinstance(obj, (set, frozenset)) else \
+            (("(", ")") if isinstance(obj, tuple) else ("[", "]"))
+        partes: List[str] = []
+        largo = 1
+        for item in (obj.items() if es_dict else obj):
+            if largo >= limite:
+                partes.append("...")
+                break
+            if es_dict:
+                clave = _repr_acotado(item[0], limite - largo, nivel + 1)
+                parte = clave + ": " + _repr_acotado(item[1], limite - largo - len(clave), nivel + 1)
+            else:
+                parte = _repr_acotado(item, limite - largo, nivel + 1)
+            partes.append(parte)
+            largo += len(parte) + 2
+        return abre + ", ".join(partes) + cierra
+    try:
+        return repr(obj)[:limite]
+    except Exception:
+        return ""
+
+MARCADORES_THETA = MarcadoresTheta()
+
+def _theta_desde_conteos(n: int, desconocidas: int, conflicto: bool) -> float:
+    """Reglas A2.2 a partir de los conteos de `MarcadoresTheta.escanear`."""
+    if n == 0:
         return 0.0
-    texts = [str(x).lower().strip() for x in cluster]
-    unknowns = sum(1 for t in texts if "unknown" in t)
-    if unknowns > 0:
-        return clamp(unknowns / len(cluster), 0.0, 1.0)
-    if len(cluster) < 6:
+    if desconocidas > 0:
+        return clamp(desconocidas / n, 0.0, 1.0)
+    if n < 6:
         return 0.0
-    if any("model a" in t for t in texts) and any("model b" in t for t in texts):
+    if conflicto:
         return 1.0
     return THETA_BASE
 
+def calcular_theta(cluster: List[Any], marcadores: Optional[MarcadoresTheta] = None) -> float:
+    """
+    Detector de Tensión Global y Conflicto A2.2.
+    - marcadores: `MarcadoresTheta` propio; por defecto "unknown" / "model a" + "model b".
+    """
+    if not cluster:
+        return 0.0
+    return _theta_desde_conteos(*(marcadores or MARCADORES_THETA).escanear(cluster, exhaustivo=False))
+
 # Backwards compatibility alias
 compute_theta = calcular_theta
 
 def theta_for_two_clusters(c1: List[Any], c2: List[Any]) -> Dict[str, float]:
+    # Cada cluster se escanea una vez; el combinado sale de sumar conteos y
+    # unir máscaras de conflicto (sin copiar c1 + c2 ni re-escanear).
+    n1, d1, m1 = MARCADORES_THETA.resumir(c1)
+    n2, d2, m2 = MARCADORES_THETA.resumir(c2)
     return {
-        "theta_c1": compute_theta(c1),
-        "theta_c2": compute_theta(c2),
-        "theta_combined": compute_theta(c1 + c2)
+        "theta_c1": _theta_desde_conteos(n1, d1, MARCADORES_THETA.es_conflicto(m1)),
+        "theta_c2": _theta_desde_conteos(n2, d2, MARCADORES_THETA.es_conflicto(m2)),
+        "theta_combined": _theta_desde_conteos(n1 + n2, d1 + d2, MARCADORES_THETA.es_conflicto(m1 | m2))
     }
 
 # ═════════════════════════════════════════════════════════════════════════==
 # L4 - PROCESADOR OMEGA (INGESTION ROBUSTA + DECISIONES)
 # ═════════════════════════════════════════════════════════════════════════==
-def procesar_flujo_omega(data: List[Any], directiva: Dict[str, Any]) -> Dict[str, Any]:
+MODOS_FLUJO = ("auto", "escalar", "vectorizado", "fusionado")
+
+def procesar_flujo_omega(
+    data: List[Any],
+    directiva: Dict[str, Any],
+    modo: str = "auto",
+    compacto: bool = False,
+    clave_flujo: Optional[Hashable] = None
+) -> Dict[str, Any]:
     """
     Integración total de búnkeres con ingestión robusta.
     - Convierte valores numéricos (int/float/strings numéricos) a floats.
     - Ignora entradas no convertibles o no finitas.
     - Clampa los datos a escala [0,1] para L3.
     - Mantiene compatibilidad con directivas meta/force del original.
+    - modo: "escalar" (bucle Python puro de referencia), "fusionado" (una sola
+      pasada: conteo, suma de cuadrados respecto al centro y cola L1, sin lista
+      saneada), "vectorizado" (NumPy sobre cualquier array-like numérico 1-D) o
+      "auto" (vectorizado si `data` ya es ndarray o una fuente buffer-protocol
+      tipada: array.array, memoryview, leída sin copia; fusionado en otro caso).
+      Sin NumPy, o con datos no numéricos homogéneos, no se vectoriza.
+    - compacto: si True retorna un `ResultadoFlujo` (__slots__, Mapping de sólo
+      lectura con `.to_dict()`) en lugar de un dict nuevo.
+    - clave_flujo: stream / tenant; L1 usa su guardián de `registro_guardianes`
+      (epsilon/ventana propios) en lugar del global `guardian_paz`.
     """
+    if modo not in MODOS_FLUJO:
+        raise ValueError(f"modo de flujo desconocido: {modo!r}")
+
+    guardian = _guardian(clave_flujo)
+
     # 1) Ingesta y sanitización
+    arr = None
+    if _np is not None and (modo == "vectorizado" or (modo == "auto" and _es_fuente_array(data))):
+        arr = _como_array(data)
+
+    if arr is not None:
+        # 1b) Pre-chequeo L1 sobre la cola cruda: en paz se evita sanear todo el array
+        invariante = _precheck_cola_vectorizada(arr, guardian)
+        if invariante:
+            return _decidir_flujo(True, lambda: OMEGA_U, len(arr), directiva, compacto)
+        saneado = _sanear_vectorizado(arr)
+        if invariante is None:
+            invariante = saneado.size > 0 and _verificar_con(guardian, _cola_invariancia(saneado, guardian))
+        return _decidir_flujo(invariante, lambda: _ritmo_vectorizado(saneado, C_MAX / 2.0), len(arr), directiva, compacto)
+
+    if modo == "escalar" and not hasattr(data, "__len__"):
+        # Iteradores/generadores: el camino de referencia necesita len() y reversed()
+        data = list(data)
+
+    # 1b) Pre-chequeo L1 saneando desde el final: en paz no se toca el resto de `data`
+    invariante, num_data = _precheck_cola(data, guardian)
+    if invariante:
+        return _decidir_flujo(True, lambda: OMEGA_U, lambda: len(data), directiva, compacto)
+    if num_data is None and modo != "escalar":
+        c = C_MAX / 2.0
+        total, n, suma_cuadrados, cola = _kernel_fusionado(data, c, guardian)
+        if invariante is None:
+            invariante = n > 0 and _verificar_con(guardian, cola)
+        return _decidir_flujo(invariante, lambda: _ritmo_desde_suma(suma_cuadrados, n, c), total, directiva, compacto)
+    if num_data is None:
+        num_data = _sanear_escalar(data)
+    if invariante is None:
+        invariante = bool(num_data) and _verificar_con(guardian, num_data)
+    return _decidir_flujo(invariante, lambda: calcular_raiz_ritmo(num_data), lambda: len(data), directiva, compacto)
+
+def _kernel_fusionado(data: Any, c: float, guardian: Any = None) -> Tuple[int, int, float, List[float]]:
+    """
+    Una sola pasada sobre `data` con la misma sanitización que `_sanear_escalar`
+    (float + isfinite + clamp [0, min(1, OMEGA_U)] en línea). Retorna
+    (elementos leídos, n válidos, fsum de (x - c)², cola de `ventana` muestras
+    para L1) sin construir la lista saneada; `data` puede ser un iterador.
+    """
+    tope = min(1.0, OMEGA_U)
+    cola: deque = deque(maxlen=_ventana_guardian(guardian))
+    total = 0
+    n = 0
+
+    def terminos():
+        nonlocal total, n
+        for x in data:
+            total += 1
+            v = x if type(x) is float else _a_float(x)
+            if v is None or not math.isfinite(v):
+                continue
+            if v < 0.0:
+                v = 0.0
+            elif v > tope:
+                v = tope
+            cola.append(v)
+            n += 1
+            d = v - c
+            yield d * d
+
+    suma_cuadrados = math.fsum(terminos())
+    return total, n, suma_cuadrados, list(cola)
+
+def _precheck_cola(data: Any, guardian: Any = None) -> Tuple[Optional[bool], Optional[List[float]]]:
+    """
+    Sanea `data` de atrás hacia adelante sólo hasta reunir `ventana` muestras
+    válidas y decide L1 con ellas (es_invariante sólo mira esa cola).
+    Retorna (invariante, num_data):
+    - invariante None si no se pudo decidir (sin ventana conocida o `data` no
+      admite reversed(), p.ej. generadores).
+    - num_data es la lista saneada completa si la cola agotó `data`; si no, None.
+    """
+    guardian = _guardian() if guardian is None else guardian
+    ventana = _ventana_guardian(guardian)
+    if ventana is None:
+        return None, None
+    try:
+        it = reversed(data)
+    except TypeError:
+        return None, None
+
+    cola: List[float] = []
+    for x in it:
+        val = x if type(x) is float else _a_float(x)
+        if val is None or not math.isfinite(val):
+            continue
+        cola.append(clamp(val, 0.0, 1.0))
+        if len(cola) == ventana:
+            break
+    else:
+        # Se recorrió todo `data`: la cola ya es la sanitización completa
+        cola.reverse()
+        return bool(cola) and _verificar_con(guardian, cola), cola
+    cola.reverse()
+    return _verificar_con(guardian, cola), None
+
+def _precheck_cola_vectorizada(arr: Any, guardian: Any = None) -> Optional[bool]:
+    """
+    Versión array de `_precheck_cola`: si las últimas `ventana` muestras crudas
+    son finitas, forman exactamente la cola saneada y deciden L1. None si no.
+    """
+    guardian = _guardian() if guardian is None else guardian
+    ventana = _ventana_guardian(guardian)
+    if ventana is None or arr.size < ventana:
+        return None
+    cola = arr[-ventana:]
+    if not _np.isfinite(cola).all():
+        return None
+    return _verificar_con(guardian, _np.clip(cola, 0.0, min(1.0, OMEGA_U)).tolist())
+
+def _sanear_escalar(data: Any) -> List[float]:
+    """Camino escalar: conversión por tipo (`_a_float`) + isfinite + clamp elemento a elemento."""
+    tope = min(1.0, OMEGA_U)
     num_data: List[float] = []
     for x in data:
-        try:
-            val = float(x)
-            if not math.isfinite(val):
-                continue
-            num_data.append(clamp(val, 0.0, 1.0))
-        except Exception:
+        val = x if type(x) is float else _a_float(x)
+        if val is None or not math.isfinite(val):
             continue
-
+        num_data.append(0.0 if val <= 0.0 else (tope if val > tope else val))
+    return num_data
+
+def _decidir_flujo(
+    invariante: bool,
+    ritmo: Callable[[], float],
+    processed_count: Any,
+    directiva: Dict[str, Any],
+    compacto: bool = False
+) -> Dict[str, Any]:
+    """
+    Pasos 2-5 de L4, comunes a todos los modos de ingesta.
+    `ritmo` se evalúa de forma perezosa: en paz (L1) no se calcula.
+    `processed_count` es un int o un callable que lo produce; sólo se lee en
+    el camino meta/force.
+    """
     # 2) Verificar invariancia (L1) PRIMERO — si hay paz, bloquear procesamiento
-    if num_data and verificar_invariancia(num_data):
+    if invariante:
+        if compacto:
+            return ResultadoFlujo(FLUJO_PAZ)
         return {
             "status": "basal",
             "path": "safety_lock",
@@ -268,27 +775,32 @@ def procesar_flujo_omega(data: List[Any], directiva: Dict[str, Any]) -> Dict[str
 
     # 4) Si hay meta o force → abrir evolving (autorización meta)
     if is_meta or is_force:
+        if callable(processed_count):
+            processed_count = processed_count()
         # calcular ritmo para incluir en metadata opcional
-        ritmo = calcular_raiz_ritmo(num_data) if num_data else OMEGA_U
+        if compacto:
+            return ResultadoFlujo(FLUJO_EVOLVING, ritmo(), processed_count, directiva.get('timestamp'))
         return {
             "status": "evolving",
             "path": "deep_evolution",
             "auth_level": "meta_v2.6",
-            "processed_count": len(data),
+            "processed_count": processed_count,
             "invariante": False,
             "timestamp": directiva.get('timestamp'),
-            "ritmo_omega": ritmo
+            "ritmo_omega": ritmo()
         }
 
     # 5) Si no hay override, calcular ritmo y devolver diagnostico seguro
-    ritmo = calcular_raiz_ritmo(num_data)
+    valor_ritmo = ritmo()
+    diagnostico = "ARRITMIA" if valor_ritmo < BURNOUT_THRESHOLD else "SIN_AUTH"
+    if compacto:
+        return ResultadoFlujo(FLUJO_BASAL, valor_ritmo, diagnostico=diagnostico)
     return {
         "status": "basal",
         "path": "safety_lock",
-        "ritmo_omega": ritmo,
-        "diagnostico": "ARRITMIA" if ritmo < BURNOUT_THRESHOLD else "SIN_AUTH"
+        "ritmo_omega": valor_ritmo,
+        "diagnostico": diagnostico
     }
-
 # ═════════════════════════════════════════════════════════════════════════==
 # DINÁMICA DE CAPAS - ACTUALIZACIÓN Y PENALIZACIÓN (funciones originales)
 # ═════════════════════════════════════════════════════════════════════════==
@@ -0,0 +1,202 @@
+"""
+Villasmil-Ω - L4 extendido: variantes de ingesta del Procesador Omega.
+Todas reutilizan las reglas de decisión de `core.procesar_flujo_omega`
+(L1 primero, luego meta/force, luego diagnóstico de ritmo).
+"""
+import math
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from villasmil_omega import core
+
+CHUNK_SIZE_DEFECTO = 65536
+
+
+def _bloques(iterable: Iterable[Any], chunk_size: int) -> Iterator[Any]:
+    """
+    Bloques de hasta `chunk_size` muestras. Las fuentes buffer-protocol
+    (ndarray, array('d'), memoryview, mmap vía `mapear_float64`) se cortan
+    como vistas NumPy sin copiar; el resto se agrupa con islice.
+    """
+    if core._es_fuente_array(iterable):
+        arr = core._como_array(iterable)
+        if arr is not None:
+            for i in range(0, len(arr), chunk_size):
+                yield arr[i:i + chunk_size]
+            return
+    it = iter(iterable)
+    while True:
+        bloque = list(islice(it, chunk_size))
+        if not bloque:
+            return
+        yield bloque
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# STREAMING - MEMORIA O(chunk_size + ventana)
+# ═════════════════════════════════════════════════════════════════════════==
+def procesar_flujo_omega_stream(
+    iterable: Iterable[Any],
+    directiva: Dict[str, Any],
+    chunk_size: int = CHUNK_SIZE_DEFECTO,
+    clave_flujo: Optional[Hashable] = None
+) -> Dict[str, Any]:
+    """
+    Variante streaming de `procesar_flujo_omega`.
+    - Consume `iterable` (lista, generador, buffer, mmap...) en bloques de `chunk_size`.
+    - Mantiene sólo sumas acumuladas para el RMSE del ritmo y la cola de
+      `ventana` muestras que necesita el guardián L1.
+    - Retorna el mismo dict que `procesar_flujo_omega(list(iterable), directiva)`.
+    - clave_flujo: como en `procesar_flujo_omega` (guardián L1 por stream).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser >= 1")
+
+    c = core.C_MAX / 2.0
+    guardian = core._guardian(clave_flujo)
+    cola: deque = deque(maxlen=core._ventana_guardian(guardian))
+    total = 0
+    n_validos = 0
+    # Suma de cuadrados como par (alto, bajo): cada bloque se integra con fsum
+    # y se conserva el residuo, así el total coincide con el fsum de una pasada.
+    alto = bajo = 0.0
+
+    for bloque in _bloques(iterable, chunk_size):
+        total += len(bloque)
+
+        arr = core._como_array(bloque)
+        if arr is not None:
+            saneado = core._sanear_vectorizado(arr)
+            terminos = core._np.square(saneado - c).tolist()
+            cola.extend(saneado[-cola.maxlen:].tolist() if cola.maxlen else saneado.tolist())
+        else:
+            saneado = core._sanear_escalar(bloque)
+            terminos = [(x - c) ** 2 for x in saneado]
+            cola.extend(saneado)
+
+        if not terminos:
+            continue
+        n_validos += len(terminos)
+        terminos.append(alto)
+        terminos.append(bajo)
+        nuevo = math.fsum(terminos)
+        terminos.append(-nuevo)
+        bajo = math.fsum(terminos)
+        alto = nuevo
+
+    invariante = n_validos > 0 and core._verificar_con(guardian, list(cola))
+    suma_cuadrados = math.fsum((alto, bajo))
+    return core._decidir_flujo(
+        invariante,
+        lambda: core._ritmo_desde_suma(suma_cuadrados, n_validos, c),
+        total,
+        directiva
+    )
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# BATCH - MUCHOS FLUJOS POR TICK (inline / hilos / procesos)
+# ═════════════════════════════════════════════════════════════════════════==
+EJECUTORES = ("inline", "hilos", "procesos")
+
+
+def _procesar_lote(lote: List[Tuple[Any, Dict[str, Any]]], modo: str = "auto") -> List[Dict[str, Any]]:
+    """Unidad de despacho: un bloque de pares (data, directiva) en un solo worker."""
+    return [core.procesar_flujo_omega(data, directiva, modo=modo) for data, directiva in lote]
+
+
+def _procesar_lote_aislado(lote: List[Tuple[Any, Dict[str, Any]]], modo: str = "auto") -> List[Tuple[bool, Any]]:
+    """
+    Como `_procesar_lote`, pero un payload que falla no arrastra al resto:
+    retorna (True, resultado) o (False, excepción) por cada par.
+    """
+    salida: List[Tuple[bool, Any]] = []
+    for data, directiva in lote:
+        try:
+            salida.append((True, core.procesar_flujo_omega(data, directiva, modo=modo)))
+        except Exception as exc:
+            salida.append((False, exc))
+    return salida
+
+
+def procesar_flujos_omega(
+    pares: Iterable[Tuple[Any, Dict[str, Any]]],
+    ejecutor: Union[str, Executor] = "inline",
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    modo: str = "auto"
+) -> List[Dict[str, Any]]:
+    """
+    Procesa muchos pares (data, directiva) y retorna los resultados en orden.
+    - ejecutor: "inline" (mismo hilo), "hilos" (ThreadPoolExecutor),
+      "procesos" (ProcessPoolExecutor) o cualquier `concurrent.futures.Executor`.
+    - chunksize: pares por despacho; amortiza el coste por llamada (pickling,
+      cambio de contexto). Por defecto ~4 bloques por worker; los workers se
+      toman de `max_workers` o `os.cpu_count()` (también con un Executor propio,
+      cuyo tamaño no se inspecciona: pásese `max_workers` para ajustarlo).
+    - modo: se pasa a `procesar_flujo_omega`.
+    """
+    if ejecutor not in EJECUTORES and not isinstance(ejecutor, Executor):
+        raise ValueError(f"ejecutor desconocido: {ejecutor!r}")
+    if modo not in core.MODOS_FLUJO:
+        raise ValueError(f"modo de flujo desconocido: {modo!r}")
+
+    pares = list(pares)
+    if ejecutor == "inline" or not pares:
+        return _procesar_lote(pares, modo)
+
+    workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(pares) / (workers * 4)))
+    elif chunksize < 1:
+        raise ValueError("chunksize debe ser >= 1")
+
+    lotes = [pares[i:i + chunksize] for i in range(0, len(pares), chunksize)]
+    despachar = partial(_procesar_lote, modo=modo)
+
+    if isinstance(ejecutor, Executor):
+        return [res for bloque in ejecutor.map(despachar, lotes) for res in bloque]
+
+    clase = ThreadPoolExecutor if ejecutor == "hilos" else ProcessPoolExecutor
+    with clase(max_workers=workers) as pool:
+        return [res for bloque in pool.map(despachar, lotes) for res in bloque]
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# ARCHIVOS FLOAT64 MAPEADOS EN MEMORIA (sin copia)
+# ═════════════════════════════════════════════════════════════════════════==
+def mapear_float64(ruta: str) -> Any:
+    """
+    Mapea un archivo binario de float64 (orden de bytes nativo) en memoria.
+    Retorna un ndarray de sólo lectura si hay NumPy, o un memoryview 'd' si no;
+    en ambos casos sin copiar el contenido. El mapeo se libera cuando deja de
+    haber referencias al resultado (como `numpy.memmap`).
+    """
+    with open(ruta, "rb") as f:
+        tam = os.fstat(f.fileno()).st_size
+        if tam % 8:
+            raise ValueError(f"{ruta}: tamaño {tam} no es múltiplo de 8 bytes (float64)")
+        if tam == 0:
+            # mmap no admite archivos vacíos
+            return core._np.empty(0) if core._np is not None else memoryview(b"").cast("d")
+        vista = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast("d")
+    if core._np is not None:
+        return core._np.frombuffer(vista, dtype=core._np.float64)
+    return vista
+
+
+def procesar_archivo_float64(
+    ruta: str,
+    directiva: Dict[str, Any],
+    chunk_size: int = CHUNK_SIZE_DEFECTO
+) -> Dict[str, Any]:
+    """
+    `procesar_flujo_omega` sobre un archivo binario de float64 sin cargarlo
+    en listas: el archivo se mapea y se recorre por bloques (vistas).
+    """
+    return procesar_flujo_omega_stream(mapear_float64(ruta), directiva, chunk_size=chunk_size)
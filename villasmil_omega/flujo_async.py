@@ -0,0 +1,168 @@
+"""
+Villasmil-Ω - Fachada asyncio del Procesador Omega (L4).
+Encola peticiones y las despacha en micro-lotes a un ejecutor, para que los
+handlers async no bloqueen el event loop con `procesar_flujo_omega`.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from villasmil_omega import core
+from villasmil_omega.flujo import _procesar_lote_aislado
+
+_FIN = object()    # Centinela de cierre de la cola
+_VACIO = object()  # Venció la espera del micro-lote sin nuevas peticiones
+
+
+class ProcesadorOmegaAsync:
+    """
+    Micro-batching async para L4.
+    - max_cola: profundidad de la cola; con la cola llena `procesar` espera
+      (backpressure) o, si `rechazar_si_llena`, lanza asyncio.QueueFull.
+    - max_lote: tamaño máximo de cada micro-lote.
+    - max_espera_ms: espera máxima desde la primera petición del lote antes de vaciarlo.
+    - ejecutor: Executor de concurrent.futures; None usa el ejecutor por defecto del loop.
+    - max_lotes_en_vuelo: lotes despachados simultáneamente al ejecutor.
+
+    Uso:
+        async with ProcesadorOmegaAsync(max_lote=128) as omega:
+            res = await omega.procesar(data, directiva)
+    """
+
+    def __init__(
+        self,
+        max_cola: int = 1024,
+        max_lote: int = 64,
+        max_espera_ms: float = 2.0,
+        ejecutor: Optional[Executor] = None,
+        max_lotes_en_vuelo: int = 2,
+        rechazar_si_llena: bool = False,
+        modo: str = "auto"
+    ):
+        if max_cola < 1 or max_lote < 1 or max_lotes_en_vuelo < 1:
+            raise ValueError("max_cola, max_lote y max_lotes_en_vuelo deben ser >= 1")
+        if max_espera_ms < 0:
+            raise ValueError("max_espera_ms no puede ser negativo")
+        if modo not in core.MODOS_FLUJO:
+            raise ValueError(f"modo de flujo desconocido: {modo!r}")
+        self.max_cola = max_cola
+        self.max_lote = max_lote
+        self.max_espera_ms = max_espera_ms
+        self.ejecutor = ejecutor
+        self.max_lotes_en_vuelo = max_lotes_en_vuelo
+        self.rechazar_si_llena = rechazar_si_llena
+        self.modo = modo
+
+        self._cola: Optional[asyncio.Queue] = None
+        self._despachador: Optional[asyncio.Task] = None
+        self._get: Optional[asyncio.Future] = None
+        self._en_vuelo: set = set()
+        self._cerrando = False
+
+    # ── Ciclo de vida ────────────────────────────────────────────────────────
+    async def iniciar(self) -> None:
+        """Crea la cola y la tarea despachadora dentro del loop en ejecución."""
+        if self._despachador is not None:
+            return
+        self._cola = asyncio.Queue(maxsize=self.max_cola)
+        self._cerrando = False
+        self._despachador = asyncio.get_running_loop().create_task(self._despachar())
+
+    async def cerrar(self) -> None:
+        """Deja de aceptar peticiones, vacía la cola y espera los lotes en vuelo."""
+        if self._despachador is None:
+            return
+        self._cerrando = True
+        await self._cola.put(_FIN)
+        await self._despachador
+        if self._en_vuelo:
+            await asyncio.gather(*self._en_vuelo, return_exceptions=True)
+        self._despachador = None
+
+    async def __aenter__(self) -> "ProcesadorOmegaAsync":
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.cerrar()
+
+    @property
+    def pendientes(self) -> int:
+        """Peticiones en cola aún no despachadas."""
+        return self._cola.qsize() if self._cola is not None else 0
+
+    # ── API ──────────────────────────────────────────────────────────────────
+    async def procesar(self, data: Any, directiva: Dict[str, Any]) -> Dict[str, Any]:
+        """Encola (data, directiva) y espera su dict de resultado."""
+        if self._despachador is None or self._cerrando:
+            raise RuntimeError("ProcesadorOmegaAsync no está iniciado")
+        futuro = asyncio.get_running_loop().create_future()
+        item = (data, directiva, futuro)
+        if self.rechazar_si_llena:
+            self._cola.put_nowait(item)
+        else:
+            await self._cola.put(item)
+        return await futuro
+
+    # ── Internos ─────────────────────────────────────────────────────────────
+    async def _siguiente(self, timeout: Optional[float]) -> Any:
+        """
+        Siguiente item de la cola o `_VACIO` si vence `timeout`. El get pendiente
+        no se cancela (se reutiliza en la próxima llamada) para no perder items.
+        """
+        if self._get is None:
+            self._get = asyncio.ensure_future(self._cola.get())
+        hecho, _ = await asyncio.wait({self._get}, timeout=timeout)
+        if not hecho:
+            return _VACIO
+        item = self._get.result()
+        self._get = None
+        return item
+
+    async def _despachar(self) -> None:
+        loop = asyncio.get_running_loop()
+        cupo = asyncio.Semaphore(self.max_lotes_en_vuelo)
+        fin = False
+        while not fin:
+            primero = await self._siguiente(None)
+            if primero is _FIN:
+                break
+            lote: List[Tuple[Any, Dict[str, Any], asyncio.Future]] = [primero]
+            limite = loop.time() + self.max_espera_ms / 1000.0
+            while len(lote) < self.max_lote:
+                item = await self._siguiente(max(0.0, limite - loop.time()))
+                if item is _VACIO:
+                    break
+                if item is _FIN:
+                    fin = True
+                    break
+                lote.append(item)
+
+            await cupo.acquire()
+            tarea = loop.create_task(self._ejecutar_lote(lote, cupo))
+            self._en_vuelo.add(tarea)
+            tarea.add_done_callback(self._en_vuelo.discard)
+
+    async def _ejecutar_lote(self, lote: List[Tuple[Any, Dict[str, Any], asyncio.Future]], cupo) -> None:
+        try:
+            pares = [(data, directiva) for data, directiva, _ in lote]
+            try:
+                resultados = await asyncio.get_running_loop().run_in_executor(
+                    self.ejecutor, _procesar_lote_aislado, pares, self.modo
+                )
+            except Exception as exc:
+                # Fallo del propio ejecutor (no de un payload): afecta a todo el lote
+                for _, _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(exc)
+                return
+            # Cada petición recibe su propio resultado o su propia excepción
+            for (_, _, futuro), (ok, valor) in zip(lote, resultados):
+                if futuro.done():
+                    continue
+                if ok:
+                    futuro.set_result(valor)
+                else:
+                    futuro.set_exception(valor)
+        finally:
+            cupo.release()
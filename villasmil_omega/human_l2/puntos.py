@@ -3,6 +3,8 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 import time
 
+from villasmil_omega.resultados import MedicionCompacta
+
 @dataclass
 class ConfiguracionEstandar:
     UMBRAL_CRITICO_SELF: float = 0.70
@@ -79,6 +81,9 @@ class SistemaCoherenciaMaxima:
     MAD_self: float = 0.0
     contexto: PuntoNeutroContexto = field(default_factory=PuntoNeutroContexto)
     history: List[Dict[str, Any]] = field(default_factory=list)
+    # True: cada medición se guarda/retorna como MedicionCompacta (__slots__,
+    # Mapping de sólo lectura) en vez de dicts anidados; varias veces menos memoria.
+    historial_compacto: bool = False
 
     def registrar_medicion(self, señales_internas: Dict[str, float], señales_relacionales: Dict[str, float]) -> Dict[str, Any]:
         L2_s = compute_L2_self(señales_internas, self.config)
@@ -100,6 +105,12 @@ class SistemaCoherenciaMaxima:
             else: estado_self = "SELF_ESTABLE"
 
         res_ctx = self.contexto.update(L2_c)
+        if self.historial_compacto:
+            resultado = MedicionCompacta(
+                L2_s, self.mu_self, estado_self, res_ctx["estado"], "CONTINUAR", 1.0 - (sigma_self / 2.0)
+            )
+            self.history.append(resultado)
+            return resultado
         resultado = {
             "L2_self": L2_s, "mu_self": self.mu_self, "estado_self": {"estado": estado_self},
             "estado_contexto": {"estado": res_ctx["estado"]}, "decision": {"accion": "CONTINUAR"},
@@ -0,0 +1,273 @@
+"""
+Villasmil-Ω - L2 extendido: Masa Crítica (MC) y Coherencia Interna (CI) en lote
+en streaming y combinable entre shards.
+Mismas reglas que `core.indice_mc(a, b)` / `core.indice_ci(aciertos, errores, ruido)`:
+total <= 0 (o no finito) da 0.0 y el cociente se clampa a [0, C_MAX].
+"""
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Iterable, Optional, Tuple, Union
+
+from villasmil_omega import core
+from villasmil_omega.flujo import CHUNK_SIZE_DEFECTO, EJECUTORES, _bloques, mapear_float64
+
+
+def _columnas_float(*columnas: Any) -> Optional[tuple]:
+    """
+    Columnas como arrays float64 con broadcasting; None si alguna no es
+    numérica. Columnas de longitudes incompatibles lanzan ValueError.
+    """
+    np = core._np
+    try:
+        arrays = [np.asarray(c, dtype=np.float64) for c in columnas]
+    except (TypeError, ValueError, OverflowError):
+        return None
+    try:
+        return np.broadcast_arrays(*arrays)
+    except ValueError:
+        raise ValueError(
+            "columnas de longitudes incompatibles: " + ", ".join(str(a.shape) for a in arrays)
+        ) from None
+
+
+def _filas(*columnas: Any) -> list:
+    """
+    Filas (tuplas) para el camino escalar. Los escalares se repiten en todas
+    las filas; columnas de distinta longitud lanzan ValueError (zip truncaría).
+    """
+    listas = [list(c) if isinstance(c, Iterable) and not isinstance(c, (str, bytes)) else None for c in columnas]
+    longitudes = {len(l) for l in listas if l is not None}
+    if len(longitudes) > 1:
+        raise ValueError(f"columnas de longitudes incompatibles: {sorted(longitudes)}")
+    n = longitudes.pop() if longitudes else 1
+    return list(zip(*(l if l is not None else [c] * n for l, c in zip(listas, columnas))))
+
+
+def _cociente_clampado(numerador: Any, total: Any) -> Any:
+    """`clamp(numerador / total, 0, C_MAX) if total > 0 else 0.0` elemento a elemento."""
+    np = core._np
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        r = numerador / total
+    r = np.where(np.isfinite(r), np.clip(r, 0.0, min(core.C_MAX, core.OMEGA_U)), 0.0)
+    return np.where(total > 0, r, 0.0)
+
+
+def indices_mc(a: Any, b: Any) -> Any:
+    """
+    MC por fila para columnas de conteos `a`, `b`: `core.indice_mc(a[i], b[i])`.
+    Retorna ndarray si hay NumPy y las columnas son numéricas; si no, lista
+    calculada fila a fila con la función escalar.
+    """
+    if core._np is not None:
+        cols = _columnas_float(a, b)
+        if cols is not None:
+            a, b = cols
+            with core._np.errstate(invalid="ignore", over="ignore"):
+                total = a + b
+            return _cociente_clampado(a, total)
+    return [core.indice_mc(x, y) for x, y in _filas(a, b)]
+
+
+def indices_ci(aciertos: Any, errores: Any, ruido: Any = None) -> Any:
+    """
+    CI por fila: `core.indice_ci(aciertos[i], errores[i], ruido[i])`
+    (ruido=None equivale a 0 en todas las filas).
+    """
+    if core._np is not None:
+        cols = _columnas_float(aciertos, errores, 0.0 if ruido is None else ruido)
+        if cols is not None:
+            a, e, r = cols
+            with core._np.errstate(invalid="ignore", over="ignore"):
+                total = a + e + r
+            return _cociente_clampado(a, total)
+    if ruido is None:
+        return [core.indice_ci(x, y) for x, y in _filas(aciertos, errores)]
+    return [core.indice_ci(x, y, z) for x, y, z in _filas(aciertos, errores, ruido)]
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# CI EN STREAMING - CONTEOS POR VENTANA O CON DECAIMIENTO, O(1) POR EVENTO
+# ═════════════════════════════════════════════════════════════════════════==
+ACIERTO = "acierto"
+ERROR = "error"
+RUIDO = "ruido"
+_RESULTADOS = {ACIERTO: 0, ERROR: 1, RUIDO: 2}
+
+
+class ContadorCI:
+    """
+    Conteos (aciertos, errores, ruido) alimentados evento a evento.
+    - sin parámetros: conteo acumulado desde el inicio.
+    - ventana=k: sólo los últimos k eventos (el más antiguo sale al entrar uno nuevo).
+    - semivida=h: decaimiento exponencial; un evento pesa la mitad tras h eventos.
+    `ci` es `core.indice_ci(*conteos)` en cualquier momento, sin re-escanear historial.
+    """
+
+    def __init__(self, ventana: Optional[int] = None, semivida: Optional[float] = None):
+        if ventana is not None and semivida is not None:
+            raise ValueError("ventana y semivida son excluyentes")
+        if ventana is not None and ventana < 1:
+            raise ValueError("ventana debe ser >= 1 o None")
+        if semivida is not None and not semivida > 0:
+            raise ValueError("semivida debe ser > 0 o None")
+        self.ventana = ventana
+        self.semivida = semivida
+        self._factor = 0.5 ** (1.0 / semivida) if semivida is not None else 1.0
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        self._conteos = [0, 0, 0] if self.semivida is None else [0.0, 0.0, 0.0]
+        self._eventos: Optional[deque] = deque() if self.ventana is not None else None
+        self.eventos = 0  # eventos registrados desde el último reinicio
+
+    def registrar(self, resultado: str) -> float:
+        """Añade un evento (ACIERTO, ERROR o RUIDO) y retorna el CI actualizado."""
+        try:
+            i = _RESULTADOS[resultado]
+        except (KeyError, TypeError):
+            raise ValueError(f"resultado desconocido: {resultado!r}") from None
+        conteos = self._conteos
+        if self._factor != 1.0:
+            f = self._factor
+            conteos[0] *= f
+            conteos[1] *= f
+            conteos[2] *= f
+        conteos[i] += 1
+        self.eventos += 1
+        if self._eventos is not None:
+            self._eventos.append(i)
+            if len(self._eventos) > self.ventana:
+                conteos[self._eventos.popleft()] -= 1
+        return self.ci
+
+    @property
+    def conteos(self) -> Tuple[float, float, float]:
+        """(aciertos, errores, ruido) vigentes (ponderados si hay semivida)."""
+        return tuple(self._conteos)
+
+    @property
+    def ci(self) -> float:
+        return core.indice_ci(*self._conteos)
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# MC COMBINABLE - (conteo, suma compensada) POR SHARD, MAP-REDUCE
+# ═════════════════════════════════════════════════════════════════════════==
+class ResumenMC:
+    """
+    Resumen asociativo de muestras MC: conteo y suma compensada (Neumaier).
+    Cada shard construye el suyo y `fusionar` (o `+`) los combina en O(1);
+    `mc` equivale a `core.indice_mc(todas_las_muestras)` (salvo redondeo de la
+    suma). Como en la función escalar, una sola muestra no numérica anula el MC.
+    """
+    __slots__ = ("n", "suma", "comp", "invalido")
+
+    def __init__(self, n: int = 0, suma: float = 0.0, comp: float = 0.0, invalido: bool = False):
+        self.n = n
+        self.suma = suma
+        self.comp = comp
+        self.invalido = invalido
+
+    @classmethod
+    def desde(cls, muestras: Iterable[Any]) -> "ResumenMC":
+        resumen = cls()
+        resumen.extender(muestras)
+        return resumen
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _sumar(self, t: float) -> None:
+        s = self.suma + t
+        if abs(self.suma) >= abs(t):
+            self.comp += (self.suma - s) + t
+        else:
+            self.comp += (t - s) + self.suma
+        self.suma = s
+
+    def agregar(self, muestra: Any) -> None:
+        self.n += 1
+        v = core._a_float(muestra)
+        if v is None:
+            self.invalido = True
+        else:
+            self._sumar(v)
+
+    def extender(self, muestras: Iterable[Any], chunk_size: int = CHUNK_SIZE_DEFECTO) -> None:
+        """
+        Añade muestras. Las fuentes buffer (ndarray, array('d'), mmap) se suman
+        por bloques en NumPy y cada suma de bloque entra en la compensación.
+        """
+        for bloque in _bloques(muestras, chunk_size):
+            if core._np is not None and isinstance(bloque, core._np.ndarray):
+                self.n += len(bloque)
+                self._sumar(float(bloque.sum()))
+            else:
+                for muestra in bloque:
+                    self.agregar(muestra)
+
+    def fusionar(self, otro: "ResumenMC") -> "ResumenMC":
+        """Nuevo resumen de la unión de ambos shards (no modifica ninguno)."""
+        combinado = ResumenMC(self.n + otro.n, self.suma, self.comp, self.invalido or otro.invalido)
+        combinado._sumar(otro.suma)
+        combinado._sumar(otro.comp)
+        return combinado
+
+    __add__ = fusionar
+
+    @property
+    def total(self) -> float:
+        return self.suma + self.comp
+
+    @property
+    def mc(self) -> float:
+        if self.n == 0 or self.invalido:
+            return 0.0
+        return core.clamp(self.total / self.n, 0.0, core.C_MAX)
+
+    def __repr__(self) -> str:
+        return f"ResumenMC(n={self.n}, total={self.total!r}, invalido={self.invalido})"
+
+
+def _resumir_mc_archivo(ruta: str, chunk_size: int) -> Tuple[int, float, float]:
+    """Unidad de trabajo: (n, suma, compensación) de un archivo float64."""
+    resumen = ResumenMC()
+    resumen.extender(mapear_float64(ruta), chunk_size)
+    return resumen.n, resumen.suma, resumen.comp
+
+
+def resumir_mc_archivos(
+    rutas: Iterable[str],
+    ejecutor: Union[str, Executor] = "procesos",
+    max_workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE_DEFECTO
+) -> ResumenMC:
+    """
+    MC sobre muestras repartidas en archivos binarios float64 (ver
+    `flujo.mapear_float64`): cada archivo se resume en un worker, mapeado y por
+    bloques, y los resúmenes se fusionan; ninguna lista de muestras se materializa.
+    `resumir_mc_archivos(rutas).mc` es el MC de todas las muestras juntas.
+    - ejecutor: "procesos" (por defecto), "hilos", "inline" o un Executor.
+    """
+    if ejecutor not in EJECUTORES and not isinstance(ejecutor, Executor):
+        raise ValueError(f"ejecutor desconocido: {ejecutor!r}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser >= 1")
+    rutas = list(rutas)
+    resumir = partial(_resumir_mc_archivo, chunk_size=chunk_size)
+
+    if ejecutor == "inline" or len(rutas) <= 1:
+        parciales = map(resumir, rutas)
+    elif isinstance(ejecutor, Executor):
+        parciales = ejecutor.map(resumir, rutas)
+    else:
+        clase = ThreadPoolExecutor if ejecutor == "hilos" else ProcessPoolExecutor
+        with clase(max_workers=max_workers or os.cpu_count() or 1) as pool:
+            parciales = list(pool.map(resumir, rutas))
+
+    total = ResumenMC()
+    for parcial in parciales:
+        total = total.fusionar(ResumenMC(*parcial))
+    return total
@@ -0,0 +1,135 @@
+"""
+Villasmil-Ω - Tipos de resultado compactos (__slots__).
+Alternativa opt-in a los dicts anidados de L4 (`procesar_flujo_omega`) y de
+`SistemaCoherenciaMaxima.registrar_medicion`. Son Mappings de sólo lectura:
+`res["clave"]`, `res.get(...)`, `in`, igualdad con dicts y `.to_dict()` siguen
+funcionando, con varias veces menos memoria por resultado guardado.
+"""
+import abc
+from collections.abc import Mapping
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResultadoCompacto(Mapping):
+    """Base: las subclases definen `_claves()` y `_valor(clave)`."""
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def _claves(self) -> Tuple[str, ...]:
+        """Claves del resultado, en el orden del dict clásico."""
+
+    @abc.abstractmethod
+    def _valor(self, clave: str) -> Any:
+        """Valor de `clave` (sub-dicts construidos al leerlos)."""
+
+    def __getitem__(self, clave: str) -> Any:
+        if clave in self._claves():
+            return self._valor(clave)
+        raise KeyError(clave)
+
+    def __iter__(self):
+        return iter(self._claves())
+
+    def __len__(self) -> int:
+        return len(self._claves())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict equivalente al resultado clásico (anidados incluidos)."""
+        return {k: self._valor(k) for k in self._claves()}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# L4 - RESULTADO DE procesar_flujo_omega
+# ═════════════════════════════════════════════════════════════════════════==
+FLUJO_PAZ = 0        # L1: sistema en paz (safety_lock + invariante)
+FLUJO_EVOLVING = 1   # meta/force: deep_evolution
+FLUJO_BASAL = 2      # sin override: diagnóstico de ritmo
+
+_CLAVES_FLUJO = {
+    FLUJO_PAZ: ("status", "path", "invariante", "razon", "energia_ahorrada"),
+    FLUJO_EVOLVING: ("status", "path", "auth_level", "processed_count",
+                     "invariante", "timestamp", "ritmo_omega"),
+    FLUJO_BASAL: ("status", "path", "ritmo_omega", "diagnostico"),
+}
+
+_CONSTANTES_FLUJO = {
+    FLUJO_PAZ: {"status": "basal", "path": "safety_lock", "invariante": True,
+                "razon": "Sistema en paz - no requiere procesamiento", "energia_ahorrada": True},
+    FLUJO_EVOLVING: {"status": "evolving", "path": "deep_evolution",
+                     "auth_level": "meta_v2.6", "invariante": False},
+    FLUJO_BASAL: {"status": "basal", "path": "safety_lock"},
+}
+
+
+class ResultadoFlujo(ResultadoCompacto):
+    """Resultado L4: sólo guarda la forma y los campos variables."""
+    __slots__ = ("forma", "ritmo_omega", "processed_count", "timestamp", "diagnostico")
+
+    def __init__(
+        self,
+        forma: int,
+        ritmo_omega: Optional[float] = None,
+        processed_count: Optional[int] = None,
+        timestamp: Any = None,
+        diagnostico: Optional[str] = None
+    ):
+        self.forma = forma
+        self.ritmo_omega = ritmo_omega
+        self.processed_count = processed_count
+        self.timestamp = timestamp
+        self.diagnostico = diagnostico
+
+    def _claves(self) -> Tuple[str, ...]:
+        return _CLAVES_FLUJO[self.forma]
+
+    def _valor(self, clave: str) -> Any:
+        constantes = _CONSTANTES_FLUJO[self.forma]
+        if clave in constantes:
+            return constantes[clave]
+        return getattr(self, clave)
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# HUMAN L2 - MEDICIÓN DE SistemaCoherenciaMaxima
+# ═════════════════════════════════════════════════════════════════════════==
+_CLAVES_MEDICION = ("L2_self", "mu_self", "estado_self", "estado_contexto",
+                    "decision", "coherencia_score")
+
+
+class MedicionCompacta(ResultadoCompacto):
+    """
+    Medición L2 plana. Los sub-dicts clásicos ({"estado": ...}, {"accion": ...})
+    se construyen al leerlos; no se guardan.
+    """
+    __slots__ = ("L2_self", "mu_self", "estado_self", "estado_contexto", "accion", "coherencia_score")
+
+    def __init__(
+        self,
+        L2_self: float,
+        mu_self: float,
+        estado_self: str,
+        estado_contexto: str,
+        accion: str,
+        coherencia_score: float
+    ):
+        self.L2_self = L2_self
+        self.mu_self = mu_self
+        self.estado_self = estado_self
+        self.estado_contexto = estado_contexto
+        self.accion = accion
+        self.coherencia_score = coherencia_score
+
+    def _claves(self) -> Tuple[str, ...]:
+        return _CLAVES_MEDICION
+
+    def _valor(self, clave: str) -> Any:
+        if clave == "estado_self":
+            return {"estado": self.estado_self}
+        if clave == "estado_contexto":
+            return {"estado": self.estado_contexto}
+        if clave == "decision":
+            return {"accion": self.accion}
+        return getattr(self, clave)
@@ -0,0 +1,246 @@
+"""
+Villasmil-Ω - L3 extendido: Metrónomo incremental y por lotes.
+Mismo índice que `core.calcular_raiz_ritmo` (RMSE normalizado con raíz sobre
+muestras saneadas: finitas y clampadas a [0, OMEGA_U]), calculado a partir
+de estadísticos suficientes (n, Σ(x - c)²) en lugar de re-escanear el historial.
+"""
+import math
+from collections import deque
+from itertools import accumulate
+from typing import Any, Optional
+
+from villasmil_omega import core
+
+
+def _sanear_muestra(x: Any) -> Optional[float]:
+    """Misma sanitización por muestra que calcular_raiz_ritmo; None si se descarta."""
+    v = core._a_float(x)
+    if v is None or not math.isfinite(v):
+        return None
+    return core.clamp(v, 0.0, 1.0)
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# ACUMULADOR ONLINE - O(1) POR MUESTRA
+# ═════════════════════════════════════════════════════════════════════════==
+class RitmoAcumulador:
+    """
+    Índice L3 incremental.
+    - ventana=None: ventana ilimitada; sólo guarda (n, suma) — memoria O(1).
+    - ventana=k: ventana deslizante de las últimas k muestras válidas; al
+      llegar la k+1-ésima se descarta la más antigua, ambas en O(1).
+    `indice` equivale a `calcular_raiz_ritmo(muestras_en_ventana, centro)`.
+    """
+
+    def __init__(self, centro: Optional[float] = None, ventana: Optional[int] = None):
+        if ventana is not None and ventana < 1:
+            raise ValueError("ventana debe ser >= 1 o None")
+        self.centro = centro if centro is not None else (core.C_MAX / 2.0)
+        self.ventana = ventana
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        self.n = 0
+        self._suma = 0.0
+        self._comp = 0.0  # compensación Neumaier de la suma
+        self._terminos: Optional[deque] = deque() if self.ventana is not None else None
+        self._descartes = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _sumar(self, t: float) -> None:
+        s = self._suma + t
+        if abs(self._suma) >= abs(t):
+            self._comp += (self._suma - s) + t
+        else:
+            self._comp += (t - s) + self._suma
+        self._suma = s
+
+    def agregar(self, valor: Any) -> bool:
+        """Añade una muestra; retorna False si se descarta por no numérica/no finita."""
+        v = _sanear_muestra(valor)
+        if v is None:
+            return False
+        t = (v - self.centro) ** 2
+        self._sumar(t)
+        self.n += 1
+        if self._terminos is not None:
+            self._terminos.append(t)
+            if self.n > self.ventana:
+                self.descartar()
+        return True
+
+    def descartar(self) -> None:
+        """Quita la muestra más antigua de la ventana (sólo con ventana acotada)."""
+        if self._terminos is None:
+            raise ValueError("sin ventana no se conservan muestras que descartar")
+        if not self._terminos:
+            return
+        self._sumar(-self._terminos.popleft())
+        self.n -= 1
+        self._descartes += 1
+        # Re-sincronización amortizada O(1): cada `ventana` descartes se
+        # recalcula la suma exacta para que restar no acumule deriva.
+        if self._descartes >= self.ventana:
+            self._suma = math.fsum(self._terminos)
+            self._comp = 0.0
+            self._descartes = 0
+
+    @property
+    def suma_cuadrados(self) -> float:
+        return max(0.0, self._suma + self._comp)
+
+    @property
+    def indice(self) -> float:
+        return core._ritmo_desde_suma(self.suma_cuadrados, self.n, self.centro)
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# FORMA VECTORIZADA DEL ÍNDICE (NumPy)
+# ═════════════════════════════════════════════════════════════════════════==
+def _indices_desde_sumas(suma_cuadrados: Any, n: Any, c: Any) -> Any:
+    """
+    `core._ritmo_desde_suma` elemento a elemento sobre arrays (n, Σ(x - c)², c
+    con broadcasting). Requiere NumPy.
+    """
+    np = core._np
+    n = np.asarray(n)
+    tope = min(1.0, core.OMEGA_U)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rmse = np.sqrt(np.maximum(suma_cuadrados, 0.0) / np.maximum(n, 1))
+    max_dev = np.maximum(np.maximum(np.abs(c - 0.0), np.abs(1.0 - c)), core.EPS)
+    dev_norm = np.clip(rmse / max_dev, 0.0, tope)
+    indices = np.clip(1.0 - np.sqrt(dev_norm), 0.0, core.OMEGA_U)
+    return np.where(n < 2, core.OMEGA_U, indices)
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# LOTES - MATRIZ (agentes × muestras)
+# ═════════════════════════════════════════════════════════════════════════==
+def calcular_raiz_ritmo_matriz(matriz: Any, centros: Any = None) -> Any:
+    """
+    Índice L3 por fila de una matriz (agentes × muestras) en una sola pasada
+    vectorizada. Cada fila se sanea por separado (no finitos fuera, clamp).
+    - centros: None (C_MAX / 2), un escalar o un vector con un centro por fila.
+    Retorna un ndarray de longitud `filas`, igual a `calcular_raiz_ritmo(fila,
+    centro)` fila a fila (salvo redondeo de la suma: NumPy suma por pares).
+    Sin NumPy, o si la matriz no es numérica, retorna una lista calculada fila a fila.
+    """
+    np = core._np
+    X = None
+    if np is not None:
+        try:
+            X = np.asarray(matriz, dtype=np.float64)
+        except (TypeError, ValueError, OverflowError):
+            X = None
+    if X is None:
+        filas = list(matriz)
+        if centros is None or isinstance(centros, (int, float)):
+            centros = [centros] * len(filas)
+        return [core.calcular_raiz_ritmo(list(f), centro=c) for f, c in zip(filas, centros)]
+
+    if X.ndim != 2:
+        raise ValueError(f"se esperaba una matriz 2-D, no {X.ndim}-D")
+    if centros is None:
+        centros = core.C_MAX / 2.0
+    c = np.broadcast_to(np.asarray(centros, dtype=np.float64), (X.shape[0],))[:, None]
+
+    validos = np.isfinite(X)
+    V = np.clip(np.where(validos, X, 0.0), 0.0, min(1.0, core.OMEGA_U))
+    suma = np.where(validos, np.square(V - c), 0.0).sum(axis=1)
+    return _indices_desde_sumas(suma, validos.sum(axis=1), c[:, 0])
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# MULTI-CENTRO - ESTADÍSTICOS SUFICIENTES COMPARTIDOS
+# ═════════════════════════════════════════════════════════════════════════==
+class EstadisticosRitmo:
+    """
+    Estadísticos suficientes de un historial saneado: n, media y M2 = Σ(x - media)².
+    Para cualquier centro c: Σ(x - c)² = M2 + n·(media - c)² (forma centrada,
+    estable numéricamente). Se sanea una vez y cada centro cuesta O(1).
+    """
+    __slots__ = ("n", "media", "m2")
+
+    def __init__(self, n: int, media: float, m2: float):
+        self.n = n
+        self.media = media
+        self.m2 = m2
+
+    @classmethod
+    def desde(cls, historial: Any) -> "EstadisticosRitmo":
+        """Sanea `historial` como calcular_raiz_ritmo y calcula (n, media, M2)."""
+        arr = core._como_array(historial) if core._es_fuente_array(historial) else None
+        if arr is not None:
+            saneado = core._sanear_vectorizado(arr).tolist()
+        else:
+            saneado = core._sanear_escalar(historial) if historial is not None else []
+        n = len(saneado)
+        if n == 0:
+            return cls(0, 0.0, 0.0)
+        media = math.fsum(saneado) / n
+        return cls(n, media, math.fsum((x - media) ** 2 for x in saneado))
+
+    def suma_cuadrados(self, centro: float) -> float:
+        return self.m2 + self.n * (self.media - centro) ** 2
+
+    def indice(self, centro: Optional[float] = None) -> float:
+        c = centro if centro is not None else (core.C_MAX / 2.0)
+        return core._ritmo_desde_suma(self.suma_cuadrados(c), self.n, c)
+
+    def indices(self, centros: Any) -> Any:
+        """Índice para cada centro; ndarray si hay NumPy, lista si no."""
+        np = core._np
+        if np is None:
+            return [self.indice(c) for c in centros]
+        c = np.asarray(centros, dtype=np.float64)
+        suma = self.m2 + self.n * np.square(self.media - c)
+        return _indices_desde_sumas(suma, np.full(c.shape, self.n), c)
+
+
+def calcular_raiz_ritmo_centros(historial: Any, centros: Any) -> Any:
+    """
+    `calcular_raiz_ritmo(historial, centro=c)` para todos los `centros` con una
+    sola sanitización: O(n + k) en lugar de O(k·n).
+    """
+    return EstadisticosRitmo.desde(historial).indices(centros)
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# SERIE RODANTE - SUMAS ACUMULADAS, O(n)
+# ═════════════════════════════════════════════════════════════════════════==
+def calcular_raiz_ritmo_rodante(historial: Any, ventana: int, centro: Optional[float] = None) -> Any:
+    """
+    Índice L3 en cada posición i sobre la ventana de posiciones
+    [max(0, i - ventana + 1), i], es decir
+    `calcular_raiz_ritmo(historial[max(0, i - ventana + 1):i + 1], centro)`.
+    Las muestras no finitas/no numéricas son huecos: ocupan posición pero no
+    cuentan. Usa sumas acumuladas de (x - c)² y de conteos válidos: O(n) total.
+    Retorna ndarray si hay NumPy, lista si no.
+    """
+    if ventana < 1:
+        raise ValueError("ventana debe ser >= 1")
+    c = centro if centro is not None else (core.C_MAX / 2.0)
+    np = core._np
+
+    if np is None:
+        muestras = [_sanear_muestra(x) for x in historial]
+        P = [0.0, *accumulate(0.0 if v is None else (v - c) ** 2 for v in muestras)]
+        N = [0, *accumulate(0 if v is None else 1 for v in muestras)]
+        return [
+            core._ritmo_desde_suma(max(0.0, P[i + 1] - P[lo]), N[i + 1] - N[lo], c)
+            for i, lo in ((i, max(0, i - ventana + 1)) for i in range(len(muestras)))
+        ]
+
+    x = core._como_array(historial)
+    if x is None:
+        x = np.array([float("nan") if v is None else v for v in map(_sanear_muestra, historial)],
+                     dtype=np.float64)
+    validos = np.isfinite(x)
+    V = np.clip(np.where(validos, x, 0.0), 0.0, min(1.0, core.OMEGA_U))
+    P = np.concatenate(([0.0], np.cumsum(np.where(validos, np.square(V - c), 0.0))))
+    N = np.concatenate(([0], np.cumsum(validos)))
+    fin = np.arange(1, x.size + 1)
+    inicio = np.maximum(fin - ventana, 0)
+    return _indices_desde_sumas(P[fin] - P[inicio], N[fin] - N[inicio], c)
@@ -0,0 +1,283 @@
+"""
+Villasmil-Ω - L3 extendido: tensión A2.2 (theta) incremental y combinable.
+Mismo resultado que `core.calcular_theta`, calculado a partir de un resumen
+por cluster (premisas, premisas desconocidas, máscara de marcadores de
+conflicto vistos) en lugar de re-escanear las premisas.
+"""
+import array
+import math
+import mmap
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from villasmil_omega import core
+from villasmil_omega.flujo import EJECUTORES
+
+
+class AcumuladorTheta:
+    """
+    Resumen combinable de un cluster.
+    - agregar / extender: O(1) por premisa (más la búsqueda de marcadores).
+    - fusionar (o `+`): O(1); el resumen de c1 + c2 sin copiar ni re-escanear.
+    `theta` equivale a `core.calcular_theta(premisas_vistas, marcadores)`.
+    """
+    __slots__ = ("marcadores", "n", "desconocidas", "mascara")
+
+    def __init__(self, marcadores: Optional[core.MarcadoresTheta] = None):
+        self.marcadores = marcadores or core.MARCADORES_THETA
+        self.n = 0
+        self.desconocidas = 0
+        self.mascara = 0
+
+    @classmethod
+    def desde(cls, cluster: Iterable[Any], marcadores: Optional[core.MarcadoresTheta] = None) -> "AcumuladorTheta":
+        """Resumen de un cluster existente en una sola pasada."""
+        acumulador = cls(marcadores)
+        acumulador.extender(cluster)
+        return acumulador
+
+    def __len__(self) -> int:
+        return self.n
+
+    def agregar(self, premisa: Any) -> None:
+        texto = self.marcadores.normalizar(premisa)
+        self.n += 1
+        if self.marcadores.es_desconocida(texto):
+            self.desconocidas += 1
+        if self.mascara != self.marcadores.completa:
+            self.mascara |= self.marcadores.mascara(texto)
+
+    def extender(self, premisas: Iterable[Any]) -> None:
+        n, desconocidas, mascara = self.marcadores.resumir(premisas)
+        self.n += n
+        self.desconocidas += desconocidas
+        self.mascara |= mascara
+
+    def fusionar(self, otro: "AcumuladorTheta") -> "AcumuladorTheta":
+        """Nuevo resumen de la unión de ambos clusters (no modifica ninguno)."""
+        if otro.marcadores != self.marcadores:
+            raise ValueError("no se pueden fusionar resúmenes con marcadores distintos")
+        combinado = AcumuladorTheta(self.marcadores)
+        combinado.n = self.n + otro.n
+        combinado.desconocidas = self.desconocidas + otro.desconocidas
+        combinado.mascara = self.mascara | otro.mascara
+        return combinado
+
+    __add__ = fusionar
+
+    @property
+    def conflicto(self) -> bool:
+        return self.marcadores.es_conflicto(self.mascara)
+
+    @property
+    def theta(self) -> float:
+        return core._theta_desde_conteos(self.n, self.desconocidas, self.conflicto)
+
+    def __repr__(self) -> str:
+        return f"AcumuladorTheta(n={self.n}, desconocidas={self.desconocidas}, mascara={self.mascara:#b})"
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# MATRIZ N×N - THETA COMBINADA POR PARES DESDE RESÚMENES
+# ═════════════════════════════════════════════════════════════════════════==
+FILAS_POR_BLOQUE = 256
+
+
+def resumir_clusters(
+    clusters: Iterable[Iterable[Any]],
+    marcadores: Optional[core.MarcadoresTheta] = None
+) -> List[AcumuladorTheta]:
+    """Un `AcumuladorTheta` por cluster (cada cluster se escanea una sola vez)."""
+    return [AcumuladorTheta.desde(c, marcadores) for c in clusters]
+
+
+def _columnas(resumenes: Sequence[AcumuladorTheta]) -> Tuple[Any, Any, Any]:
+    np = core._np
+    return (
+        np.fromiter((r.n for r in resumenes), dtype=np.int64, count=len(resumenes)),
+        np.fromiter((r.desconocidas for r in resumenes), dtype=np.int64, count=len(resumenes)),
+        np.fromiter((r.mascara for r in resumenes), dtype=np.int64, count=len(resumenes)),
+    )
+
+
+def _bloque_theta(n: Any, d: Any, m: Any, filas: slice, completa: int) -> Any:
+    """`core._theta_desde_conteos` sobre el bloque filas × todos, con broadcasting."""
+    np = core._np
+    N = n[filas, None] + n[None, :]
+    D = d[filas, None] + d[None, :]
+    conflicto = (m[filas, None] | m[None, :]) == completa if completa else np.zeros(N.shape, dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        proporcion = np.clip(D / N, 0.0, min(1.0, core.OMEGA_U))
+    theta = np.where(conflicto, 1.0, core.THETA_BASE)
+    theta = np.where(N < 6, 0.0, theta)
+    theta = np.where(D > 0, proporcion, theta)
+    return np.where(N == 0, 0.0, theta)
+
+
+def _vectorizable(resumenes: Sequence[AcumuladorTheta]) -> bool:
+    # Las máscaras caben en int64 con hasta 62 marcadores de conflicto
+    return core._np is not None and bool(resumenes) and resumenes[0].marcadores.completa < (1 << 62)
+
+
+def _validar(resumenes: Sequence[AcumuladorTheta]) -> None:
+    if any(r.marcadores != resumenes[0].marcadores for r in resumenes[1:]):
+        raise ValueError("todos los resúmenes deben usar los mismos marcadores")
+
+
+def matriz_theta(resumenes: Sequence[AcumuladorTheta]) -> Any:
+    """
+    Matriz N×N con `theta_combined` de cada par: M[i, j] es
+    `calcular_theta(cluster_i + cluster_j)` (la diagonal combina el cluster
+    consigo mismo). ndarray float64 si hay NumPy; si no, una lista de filas
+    `array('d')`.
+    """
+    resumenes = list(resumenes)
+    _validar(resumenes)
+    if not _vectorizable(resumenes):
+        return [array.array("d", ((a + b).theta for b in resumenes)) for a in resumenes]
+    n, d, m = _columnas(resumenes)
+    completa = resumenes[0].marcadores.completa
+    salida = core._np.empty((len(resumenes), len(resumenes)), dtype=core._np.float64)
+    for i in range(0, len(resumenes), FILAS_POR_BLOQUE):
+        filas = slice(i, i + FILAS_POR_BLOQUE)
+        salida[filas] = _bloque_theta(n, d, m, filas, completa)
+    return salida
+
+
+def pares_theta(resumenes: Sequence[AcumuladorTheta], umbral: float) -> List[Tuple[int, int, float]]:
+    """
+    Modo disperso: sólo los pares i < j con `theta_combined > umbral`, como
+    (i, j, theta) en orden. Se calcula por bloques de filas, sin materializar
+    la matriz completa.
+    """
+    resumenes = list(resumenes)
+    _validar(resumenes)
+    if not _vectorizable(resumenes):
+        pares = []
+        for i, a in enumerate(resumenes):
+            for j in range(i + 1, len(resumenes)):
+                theta = (a + resumenes[j]).theta
+                if theta > umbral:
+                    pares.append((i, j, theta))
+        return pares
+    np = core._np
+    n, d, m = _columnas(resumenes)
+    completa = resumenes[0].marcadores.completa
+    pares = []
+    for i in range(0, len(resumenes), FILAS_POR_BLOQUE):
+        bloque = _bloque_theta(n, d, m, slice(i, i + FILAS_POR_BLOQUE), completa)
+        filas, columnas = np.nonzero(bloque > umbral)
+        filas += i
+        superior = columnas > filas
+        filas, columnas = filas[superior], columnas[superior]
+        pares.extend(zip(filas.tolist(), columnas.tolist(), bloque[filas - i, columnas].tolist()))
+    return pares
+
+
+# ═════════════════════════════════════════════════════════════════════════==
+# CORPUS EN DISCO - ARCHIVO DE PREMISAS (UNA POR LÍNEA) MAPEADO Y EN PARALELO
+# ═════════════════════════════════════════════════════════════════════════==
+TAM_RANGO_MAX = 64 * 1024 * 1024  # bytes por rango: acota la memoria por worker
+
+
+def rangos_por_linea(ruta: str, partes: int, tam_max: int = TAM_RANGO_MAX) -> List[Tuple[int, int]]:
+    """
+    Divide el archivo en rangos de bytes [inicio, fin) que terminan justo
+    después de un salto de línea (o al final del archivo): ~`partes` rangos,
+    ninguno mayor que `tam_max` salvo que una sola línea lo sea.
+    """
+    if partes < 1 or tam_max < 1:
+        raise ValueError("partes y tam_max deben ser >= 1")
+    tam = os.path.getsize(ruta)
+    if tam == 0:
+        return []
+    objetivo = min(tam_max, max(1, math.ceil(tam / partes)))
+    rangos = []
+    with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        inicio = 0
+        while inicio < tam:
+            salto = mm.find(b"\n", min(inicio + objetivo, tam) - 1)
+            fin = tam if salto < 0 else salto + 1
+            rangos.append((inicio, fin))
+            inicio = fin
+    return rangos
+
+
+def _resumir_rango(
+    ruta: str,
+    rango: Tuple[int, int],
+    desconocido: Tuple[str, ...],
+    conflicto: Tuple[str, ...],
+    limites: Tuple[Optional[int], int],
+    encoding: str,
+    errores: str
+) -> Tuple[int, int, int]:
+    """
+    Unidad de trabajo: (premisas, desconocidas, máscara) de un rango de líneas.
+    Recibe los marcadores como tuplas (baratas de serializar) y los recompila.
+    """
+    inicio, fin = rango
+    with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        texto = mm[inicio:fin].decode(encoding, errores)
+    lineas = texto.split("\n")
+    if texto.endswith("\n"):
+        lineas.pop()
+    return core.MarcadoresTheta(desconocido, conflicto, *limites).resumir(lineas)
+
+
+def escanear_corpus(
+    ruta: str,
+    marcadores: Optional[core.MarcadoresTheta] = None,
+    ejecutor: Union[str, Executor] = "procesos",
+    max_workers: Optional[int] = None,
+    tam_rango: int = TAM_RANGO_MAX,
+    encoding: str = "utf-8",
+    errores: str = "strict"
+) -> AcumuladorTheta:
+    """
+    Resumen A2.2 de un corpus de premisas, una por línea, sin cargarlo en una
+    lista: el archivo se mapea, se parte en rangos por línea y cada rango se
+    resume en un worker; los parciales se fusionan.
+    Las líneas se separan sólo por LF ("\\n"); con CRLF el "\\r" final queda
+    en la premisa y no altera la detección de marcadores. Otros separadores que
+    sí reconoce `str.splitlines()` ("\\r" suelto, "\\x0b", "\\u2028", ...) no
+    parten la línea. Para archivos LF/CRLF, `escanear_corpus(ruta).theta`
+    equivale a `calcular_theta(texto.split("\\n"))` sin la línea vacía final.
+    - ejecutor: "procesos" (por defecto), "hilos", "inline" o un Executor.
+    - tam_rango: bytes máximos por rango (memoria acotada por worker).
+    """
+    if ejecutor not in EJECUTORES and not isinstance(ejecutor, Executor):
+        raise ValueError(f"ejecutor desconocido: {ejecutor!r}")
+    marcadores = marcadores or core.MARCADORES_THETA
+    workers = max_workers or os.cpu_count() or 1
+    rangos = rangos_por_linea(ruta, workers * 4, tam_rango)
+    resumir = partial(
+        _resumir_rango, ruta,
+        desconocido=marcadores.desconocido, conflicto=marcadores.conflicto,
+        limites=(marcadores.max_prefijo, marcadores.max_sufijo),
+        encoding=encoding, errores=errores
+    )
+
+    if ejecutor == "inline" or len(rangos) <= 1:
+        return _fusionar_parciales(map(resumir, rangos), marcadores)
+    if isinstance(ejecutor, Executor):
+        return _fusionar_parciales(ejecutor.map(resumir, rangos), marcadores)
+    clase = ThreadPoolExecutor if ejecutor == "hilos" else ProcessPoolExecutor
+    with clase(max_workers=workers) as pool:
+        return _fusionar_parciales(pool.map(resumir, rangos), marcadores)
+
+
+def _fusionar_parciales(parciales: Iterable[Tuple[int, int, int]], marcadores: core.MarcadoresTheta) -> AcumuladorTheta:
+    total = AcumuladorTheta(marcadores)
+    for n, desconocidas, mascara in parciales:
+        total.n += n
+        total.desconocidas += desconocidas
+        total.mascara |= mascara
+    return total
+
+
+def calcular_theta_corpus(ruta: str, **kwargs: Any) -> float:
+    """`calcular_theta` sobre las líneas de `ruta`; kwargs como en `escanear_corpus`."""
+    return escanear_corpus(ruta, **kwargs).theta